@@ -191,7 +191,8 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
         # Execute Claude Code and pipe output to file
         with open(request.output_file, "w") as f:
             result = subprocess.run(
-                cmd, stdout=f, stderr=subprocess.PIPE, text=True, env=env
+                cmd, stdout=f, stderr=subprocess.PIPE, text=True, env=env,
+                cwd=request.cwd
             )
 
         if result.returncode == 0:
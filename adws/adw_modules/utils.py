@@ -195,7 +195,7 @@ def load_task_input(task_id: Optional[str] = None, logger: Optional[logging.Logg
         raise FileNotFoundError(error_msg)
 
     try:
-        with open(task_input_path, "r") as f:
+        with open(task_input_path, "r", encoding="utf-8") as f:
             task_input = json.load(f)
 
         if logger:
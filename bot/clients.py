@@ -0,0 +1,50 @@
+import aiohttp
+import httpx
+import orjson
+import structlog
+
+logger = structlog.get_logger()
+
+
+def json_dumps(obj) -> str:
+    """Serialize request bodies with orjson; aiohttp expects str, not bytes."""
+    return orjson.dumps(obj).decode()
+
+
+class HTTPClients:
+    """Shared HTTP connection pools for external APIs."""
+
+    openai: httpx.AsyncClient = None
+    anthropic: httpx.AsyncClient = None
+    jira: aiohttp.ClientSession = None
+
+    @classmethod
+    async def open(cls):
+        """Create the shared clients. Must run inside the event loop."""
+        cls.openai = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+        cls.anthropic = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+        cls.jira = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20),
+            json_serialize=json_dumps,
+        )
+        logger.info("HTTP client pools created")
+
+    @classmethod
+    async def close(cls):
+        """Close the shared clients."""
+        if cls.openai:
+            await cls.openai.aclose()
+            cls.openai = None
+        if cls.anthropic:
+            await cls.anthropic.aclose()
+            cls.anthropic = None
+        if cls.jira:
+            await cls.jira.close()
+            cls.jira = None
+        logger.info("HTTP client pools closed")
@@ -31,9 +31,17 @@ class Settings(BaseSettings):
 
     # Redis Configuration
     redis_url: str = "redis://redis:6379/0"
+    redis_batch_size: int = 32
+    redis_flush_ms: int = 2
 
     # MongoDB Configuration
     mongodb_uri: str
+    mongo_max_pool_size: int = 200
+    mongo_min_pool_size: int = 10
+    mongo_max_idle_time_ms: int = 300_000
+    mongo_wait_queue_timeout_ms: int = 10_000
+    message_batch_size: int = 100
+    message_flush_ms: int = 20
 
     # Default AI Provider
     default_ai_provider: Literal["openai", "claude"] = "claude"
@@ -42,6 +50,9 @@ class Settings(BaseSettings):
     max_context_messages: int = 20
     max_context_tokens: int = 4000
 
+    # Concurrency
+    max_concurrent_handlers: int = 16
+
     # Logging
     log_level: str = "INFO"
 
@@ -0,0 +1,123 @@
+"""
+One-off data migrations, run by hand before deploying the change that needs them.
+
+Usage:
+    python -m bot.database.migrations dedupe-repositories
+    python -m bot.database.migrations drop-legacy-conversation-indexes
+"""
+import argparse
+import asyncio
+import structlog
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from bot.config import settings
+from bot.utils.logger import setup_logging
+
+logger = structlog.get_logger()
+
+# Conversation indexes replaced by the partial one_active_per_user_provider index
+LEGACY_CONVERSATION_INDEXES = (
+    "telegram_id_1_is_active_1",
+    "telegram_id_1_provider_1_is_active_1",
+)
+
+
+async def find_duplicate_repositories(database) -> list[dict]:
+    """
+    Find (telegram_id, short_name) pairs held by more than one repository.
+
+    Args:
+        database: Motor database handle
+
+    Returns:
+        One {"_id": {"telegram_id", "short_name"}, "ids": [...]} group per
+        conflicting pair, with ids oldest first
+    """
+    groups = database["repositories"].aggregate([
+        {"$group": {
+            "_id": {"telegram_id": "$telegram_id", "short_name": "$short_name"},
+            "ids": {"$push": "$_id"},
+        }},
+        {"$match": {"ids.1": {"$exists": True}}},
+    ])
+    duplicates = []
+    async for group in groups:
+        group["ids"].sort()
+        duplicates.append(group)
+    return duplicates
+
+
+async def dedupe_repositories(database) -> int:
+    """
+    Delete duplicate (telegram_id, short_name) repositories, keeping the oldest.
+
+    Every deleted document is logged in full so it can be restored by hand.
+
+    Args:
+        database: Motor database handle
+
+    Returns:
+        Number of repositories deleted
+    """
+    collection = database["repositories"]
+    removed = 0
+    for group in await find_duplicate_repositories(database):
+        kept, *stale = group["ids"]
+        async for document in collection.find({"_id": {"$in": stale}}):
+            logger.warning(
+                "Removing duplicate repository",
+                kept_id=str(kept),
+                document={**document, "_id": str(document["_id"])},
+            )
+        result = await collection.delete_many({"_id": {"$in": stale}})
+        removed += result.deleted_count
+    logger.info("Repository dedupe complete", removed=removed)
+    return removed
+
+
+async def drop_legacy_conversation_indexes(database) -> int:
+    """
+    Drop the conversation indexes superseded by the partial unique index.
+
+    Only the indexes named in LEGACY_CONVERSATION_INDEXES are touched, so
+    it is safe to run on every start; it does nothing once they are gone.
+
+    Args:
+        database: Motor database handle
+
+    Returns:
+        Number of indexes dropped
+    """
+    collection = database["conversations"]
+    existing = await collection.index_information()
+    dropped = 0
+    for name in LEGACY_CONVERSATION_INDEXES:
+        if name in existing:
+            await collection.drop_index(name)
+            logger.info("Dropped legacy conversation index", index=name)
+            dropped += 1
+    return dropped
+
+
+# Migration name -> coroutine taking the database
+_MIGRATIONS = {
+    "dedupe-repositories": dedupe_repositories,
+    "drop-legacy-conversation-indexes": drop_legacy_conversation_indexes,
+}
+
+
+async def _run(name: str):
+    """Connect with the bot's settings and run one migration."""
+    db_name = settings.mongodb_uri.split("/")[-1].split("?")[0] or settings.mongo_initdb_database
+    client = AsyncIOMotorClient(settings.mongodb_uri)
+    try:
+        await _MIGRATIONS[name](client[db_name])
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    parser = argparse.ArgumentParser(description="Run a one-off data migration")
+    parser.add_argument("migration", choices=sorted(_MIGRATIONS))
+    asyncio.run(_run(parser.parse_args().migration))
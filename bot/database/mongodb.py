@@ -6,6 +6,10 @@ from bot.models.user import User
 from bot.models.conversation import Conversation
 from bot.models.message import Message
 from bot.models.repository import Repository
+from bot.database.migrations import (
+    drop_legacy_conversation_indexes,
+    find_duplicate_repositories,
+)
 
 logger = structlog.get_logger()
 
@@ -17,19 +21,25 @@ class MongoDB:
     database = None
 
     @classmethod
-    async def connect(cls, mongodb_uri: str, database_name: str = "hermes_bot"):
+    async def connect(cls, mongodb_uri: str, database_name: str = "hermes_bot", **client_options):
         """
         Initialize MongoDB connection and Beanie ODM.
 
         Args:
             mongodb_uri: MongoDB connection string
             database_name: Database name (extracted from URI or default)
+            **client_options: Extra AsyncIOMotorClient options (e.g. pool sizing)
         """
         try:
             logger.info("Connecting to MongoDB...", uri=mongodb_uri.split("@")[-1])
-            cls.client = AsyncIOMotorClient(mongodb_uri)
+            cls.client = AsyncIOMotorClient(mongodb_uri, **client_options)
             cls.database = cls.client[database_name]
 
+            # Must run before init_beanie creates the unique indexes
+            await _check_repository_duplicates(cls.database)
+            await _dedupe_active_conversations(cls.database)
+            await drop_legacy_conversation_indexes(cls.database)
+
             # Initialize Beanie with document models
             await init_beanie(
                 database=cls.database,
@@ -48,3 +58,59 @@ class MongoDB:
             logger.info("Closing MongoDB connection...")
             cls.client.close()
             logger.info("MongoDB connection closed")
+
+
+async def _check_repository_duplicates(database):
+    """
+    Refuse to start while repositories violate the unique short-name index.
+
+    init_beanie cannot build the index over duplicates. They may differ in
+    repo_url or jira_prefix, so choosing which to keep is left to the
+    dedupe-repositories migration rather than done on connect.
+
+    Args:
+        database: Motor database handle
+
+    Raises:
+        RuntimeError: If any (telegram_id, short_name) pair is duplicated
+    """
+    duplicates = await find_duplicate_repositories(database)
+    if duplicates:
+        pairs = ", ".join(
+            f"({group['_id']['telegram_id']}, {group['_id']['short_name']!r})"
+            for group in duplicates
+        )
+        raise RuntimeError(
+            f"Duplicate repositories for (telegram_id, short_name): {pairs}. "
+            "Resolve them by hand or run "
+            "'python -m bot.database.migrations dedupe-repositories'"
+        )
+
+
+async def _dedupe_active_conversations(database):
+    """
+    Deactivate all but the newest active conversation per user and provider.
+
+    Databases created before the one-active-conversation index may hold
+    several active sessions, and init_beanie cannot build the index until
+    only one is left.
+
+    Args:
+        database: Motor database handle
+    """
+    collection = database["conversations"]
+    duplicates = collection.aggregate([
+        {"$match": {"is_active": True}},
+        {"$group": {
+            "_id": {"telegram_id": "$telegram_id", "provider": "$provider"},
+            "ids": {"$push": "$_id"},
+        }},
+        {"$match": {"ids.1": {"$exists": True}}},
+    ])
+    stale = []
+    async for group in duplicates:
+        stale.extend(sorted(group["ids"])[:-1])
+
+    if stale:
+        await collection.update_many({"_id": {"$in": stale}}, {"$set": {"is_active": False}})
+        logger.warning("Deactivated duplicate active conversations", count=len(stale))
@@ -1,27 +1,66 @@
 import structlog
 import uuid
-from datetime import datetime
+from pymongo.errors import PyMongoError
+from redis.exceptions import RedisError
 from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.constants import ChatAction
 
+from bot.clients import HTTPClients
 from bot.services.adw_parser import ADWParser
-from bot.services.jira_service import JiraService
+from bot.services.jira_service import JiraService, JiraServiceError
 from bot.services.redis_service import RedisService
 from bot.config import settings
 from bot.utils.auth import authorized_users_only
-from bot.models.repository import Repository
+from bot.models.repository import (
+    Repository,
+    RepositoryUrlView,
+    SHORT_NAME_INDEX,
+    JIRA_PREFIX_INDEX,
+)
 from bot.utils.constants import escape_markdown
 
 logger = structlog.get_logger()
 
 
+# Response templates keyed by worker status (None is the fallback)
+_STATUS_TEMPLATES: dict[str | None, str] = {
+    "started": "⚙️ *Workflow Started*\n\nTask ID: `{tid}`\n{msg}",
+    "finished": "✅ *Workflow Completed*\n\nTask ID: `{tid}`\n{msg}",
+    "failed": "❌ *Workflow Failed*\n\nTask ID: `{tid}`\n{msg}",
+    # Simplified progress format - no "Progress Update" title or task_id
+    "progress": "🔄 {msg}",
+    None: "📝 *Update*\n\nTask ID: `{tid}`\n{msg}",
+}
+
+# Acknowledgement sent once an ADW task has been queued
+_ADW_RESPONSE_TEMPLATE = (
+    "🚀 *AI-Driven Workflow Started*\n"
+    "\n"
+    "*Task ID:* `{tid}`\n"
+    "*Workflow:* {workflow}\n"
+    "*Repository:* {repo}\n"
+    "{jira_line}"
+    "\n"
+    "*Task:* {task}\n"
+    "\n"
+    "I'll notify you when the workflow completes."
+)
+
+
 # Global Redis service instance (will be initialized in main.py)
 redis_service: RedisService = None
 
 
 def set_redis_service(service: RedisService):
-    """Set the global Redis service instance."""
+    """
+    Set the global Redis service instance.
+
+    Raises:
+        ValueError: If service is None
+    """
+    if service is None:
+        raise ValueError("Redis service is required")
     global redis_service
     redis_service = service
 
@@ -53,7 +92,9 @@ async def resolve_repository(
     if parsed.get("repo_alias"):
         repo = await Repository.find_one(
             Repository.telegram_id == telegram_id,
-            Repository.short_name == parsed["repo_alias"]
+            Repository.short_name == parsed["repo_alias"],
+            projection_model=RepositoryUrlView,
+            hint=SHORT_NAME_INDEX
         )
         if repo:
             logger.info(
@@ -72,7 +113,9 @@ async def resolve_repository(
     if parsed.get("jira_prefix"):
         repo = await Repository.find_one(
             Repository.telegram_id == telegram_id,
-            Repository.jira_prefix == parsed["jira_prefix"]
+            Repository.jira_prefix == parsed["jira_prefix"],
+            projection_model=RepositoryUrlView,
+            hint=JIRA_PREFIX_INDEX
         )
         if repo:
             logger.info(
@@ -134,8 +177,10 @@ async def adw_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         message_text=message_text
     )
 
-    # Show typing indicator
-    await update.message.chat.send_action(ChatAction.TYPING)
+    # Show typing indicator without blocking on the Telegram round-trip
+    context.application.create_task(
+        update.message.chat.send_action(ChatAction.TYPING)
+    )
 
     try:
         # Parse the command
@@ -154,7 +199,7 @@ async def adw_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         # Generate task ID
-        task_id = str(uuid.uuid4())
+        task_id = uuid.uuid4().hex
 
         # Prepare task data
         task_data = {
@@ -166,9 +211,15 @@ async def adw_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "jira_ticket": parsed["jira_ticket"],
             "jira_details": None,
             "reporting_level": parsed["reporting_level"],
-            "timestamp": datetime.utcnow().isoformat()
         }
 
+        # Escape dynamic values once and reuse them in every reply
+        esc_tid = escape_markdown(task_id)
+        esc_wf = escape_markdown(parsed["workflow_name"])
+        esc_repo = escape_markdown(repo_url)
+        esc_task = escape_markdown(parsed["task_description"])
+        esc_jira = escape_markdown(parsed["jira_ticket"]) if parsed["jira_ticket"] else None
+
         # If Jira ticket is specified, fetch details and comments
         if parsed["jira_ticket"]:
             try:
@@ -176,6 +227,7 @@ async def adw_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     jira_url=settings.jira_url,
                     email=settings.jira_email,
                     api_token=settings.jira_api_token,
+                    session=HTTPClients.jira,
                 )
 
                 issue = await jira_service.get_issue_with_comments(parsed["jira_ticket"])
@@ -189,10 +241,10 @@ async def adw_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     )
                 else:
                     await update.message.reply_text(
-                        f"Warning: Jira ticket {escape_markdown(parsed['jira_ticket'])} not found. "
+                        f"Warning: Jira ticket {esc_jira} not found. "
                         "Proceeding without Jira details."
                     )
-            except Exception as e:
+            except JiraServiceError as e:
                 logger.error(
                     "Failed to fetch Jira details for ADW task",
                     task_id=task_id,
@@ -200,55 +252,40 @@ async def adw_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     error=str(e)
                 )
                 await update.message.reply_text(
-                    f"Warning: Could not fetch Jira ticket {escape_markdown(parsed['jira_ticket'])}: {escape_markdown(str(e))}\n"
+                    f"Warning: Could not fetch Jira ticket {esc_jira}: {escape_markdown(str(e))}\n"
                     "Proceeding without Jira details."
                 )
 
         # Send task to worker via Redis
-        if redis_service:
-            success = await redis_service.publish_task(task_data)
-
-            if success:
-                # Format response message with escaped dynamic values
-                response_parts = [
-                    f"🚀 *AI-Driven Workflow Started*",
-                    f"",
-                    f"*Task ID:* `{escape_markdown(task_id)}`",
-                    f"*Workflow:* {escape_markdown(task_data['workflow_name'])}",
-                    f"*Repository:* {escape_markdown(task_data['repo_url'])}",
-                ]
-
-                if task_data.get("jira_ticket"):
-                    response_parts.append(f"*Jira Ticket:* {escape_markdown(task_data['jira_ticket'])}")
-
-                response_parts.extend([
-                    f"",
-                    f"*Task:* {escape_markdown(task_data['task_description'])}",
-                    f"",
-                    f"I'll notify you when the workflow completes."
-                ])
+        success = await redis_service.publish_task(task_data)
 
-                await update.message.reply_text(
-                    "\n".join(response_parts),
-                    parse_mode="Markdown"
-                )
+        if success:
+            # Format response message with escaped dynamic values
+            jira_line = f"*Jira Ticket:* {esc_jira}\n" if esc_jira else ""
 
-                logger.info(
-                    "ADW task queued successfully",
-                    task_id=task_id,
-                    telegram_id=telegram_id
-                )
-            else:
-                await update.message.reply_text(
-                    "Failed to queue the task. Please try again later."
-                )
+            await update.message.reply_text(
+                _ADW_RESPONSE_TEMPLATE.format(
+                    tid=esc_tid,
+                    workflow=esc_wf,
+                    repo=esc_repo,
+                    jira_line=jira_line,
+                    task=esc_task
+                ),
+                parse_mode="Markdown"
+            )
+
+            logger.info(
+                "ADW task queued successfully",
+                task_id=task_id,
+                telegram_id=telegram_id
+            )
         else:
             await update.message.reply_text(
-                "Worker service is not available. Please contact the administrator."
+                "Failed to queue the task. Please try again later."
             )
-            logger.error("Redis service not initialized")
 
-    except Exception as e:
+    except (PyMongoError, RedisError) as e:
+        # Anything else propagates to the global error_handler
         logger.error(
             "Error processing ADW request",
             telegram_id=telegram_id,
@@ -299,22 +336,16 @@ async def handle_adw_response(response_data: dict, application):
         status = response_data.get("status")
         message = response_data.get("message", "")
 
-        if not all([task_id, telegram_id, status]):
+        if not (task_id and telegram_id and status):
             logger.warning("Incomplete ADW response", data=response_data)
             return
 
         # Format message based on status with escaped dynamic values
-        if status == "started":
-            text = f"⚙️ *Workflow Started*\n\nTask ID: `{escape_markdown(task_id)}`\n{escape_markdown(message)}"
-        elif status == "finished":
-            text = f"✅ *Workflow Completed*\n\nTask ID: `{escape_markdown(task_id)}`\n{escape_markdown(message)}"
-        elif status == "failed":
-            text = f"❌ *Workflow Failed*\n\nTask ID: `{escape_markdown(task_id)}`\n{escape_markdown(message)}"
-        elif status == "progress":
-            # Simplified progress format - no "Progress Update" title or task_id
-            text = f"🔄 {escape_markdown(message)}"
-        else:
-            text = f"📝 *Update*\n\nTask ID: `{escape_markdown(task_id)}`\n{escape_markdown(message)}"
+        template = _STATUS_TEMPLATES.get(status, _STATUS_TEMPLATES[None])
+        text = template.format(
+            tid=escape_markdown(task_id),
+            msg=escape_markdown(message)
+        )
 
         # Send message to user
         await application.bot.send_message(
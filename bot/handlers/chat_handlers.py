@@ -1,12 +1,13 @@
+import asyncio
 import structlog
 from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.constants import ChatAction
 
+from bot.clients import HTTPClients
 from bot.services.openai_service import OpenAIService
 from bot.services.claude_service import ClaudeService
 from bot.services.conversation_service import ConversationService
-from bot.models.message import MessageRole
 from bot.config import settings
 from bot.utils.auth import authorized_users_only
 from bot.utils.constants import escape_markdown
@@ -46,85 +47,98 @@ async def _process_chat_message(
         message_length=len(message_text),
     )
 
-    # Show typing indicator
-    await update.message.chat.send_action(ChatAction.TYPING)
+    # Show typing indicator without blocking on the Telegram round-trip
+    context.application.create_task(
+        update.message.chat.send_action(ChatAction.TYPING)
+    )
 
-    try:
-        # Get or create conversation
-        conversation = await ConversationService.get_or_create_conversation(
-            telegram_id, provider
-        )
+    # One turn at a time per user, so /new and replies see history in order
+    async with ConversationService.user_lock(telegram_id):
+        try:
+            # Get or create conversation
+            conversation = await ConversationService.get_or_create_conversation(
+                telegram_id, provider
+            )
 
-        # Get conversation history
-        history = await ConversationService.get_conversation_history(
-            conversation.session_id
-        )
+            # Get conversation history
+            history = await ConversationService.get_conversation_history(
+                conversation.session_id
+            )
 
-        # Initialize AI service
-        if provider == "openai":
-            ai_service = OpenAIService(api_key=settings.openai_api_key)
-        elif provider == "claude":
-            ai_service = ClaudeService(
-                api_key=settings.anthropic_api_key,
-                model=settings.claude_model
+            # Initialize AI service
+            if provider == "openai":
+                ai_service = OpenAIService(
+                    api_key=settings.openai_api_key,
+                    http_client=HTTPClients.openai,
+                )
+            elif provider == "claude":
+                ai_service = ClaudeService(
+                    api_key=settings.anthropic_api_key,
+                    model=settings.claude_model,
+                    http_client=HTTPClients.anthropic,
+                )
+            else:
+                await update.message.reply_text(f"Unknown provider: {provider}")
+                return
+
+            # Send message to AI
+            response = await ai_service.send_message(message_text, history)
+
+            # Save user message and assistant response (batched into one insert)
+            await asyncio.gather(
+                ConversationService.save_message(
+                    session_id=conversation.session_id,
+                    telegram_id=telegram_id,
+                    role="user",
+                    content=message_text,
+                    provider=provider,
+                ),
+                ConversationService.save_message(
+                    session_id=conversation.session_id,
+                    telegram_id=telegram_id,
+                    role="assistant",
+                    content=response.content,
+                    provider=provider,
+                    tokens_used=response.tokens_used,
+                ),
             )
-        else:
-            await update.message.reply_text(f"Unknown provider: {provider}")
-            return
-
-        # Send message to AI
-        response = await ai_service.send_message(message_text, history)
-
-        # Save user message
-        await ConversationService.save_message(
-            session_id=conversation.session_id,
-            telegram_id=telegram_id,
-            role=MessageRole.USER,
-            content=message_text,
-            provider=provider,
-        )
 
-        # Save assistant response
-        await ConversationService.save_message(
-            session_id=conversation.session_id,
-            telegram_id=telegram_id,
-            role=MessageRole.ASSISTANT,
-            content=response.content,
-            provider=provider,
-            tokens_used=response.tokens_used,
-        )
+            # The reply does not depend on conversation metadata; update it in the background
+            context.application.create_task(
+                ConversationService.update_conversation_meta(conversation.session_id, added=2)
+            )
 
-        # Escape markdown characters in AI response
-        escaped_content = escape_markdown(response.content)
-
-        # Split response if it's too long (Telegram limit: 4096 characters)
-        max_length = 4096
-        if len(escaped_content) <= max_length:
-            await update.message.reply_text(escaped_content)
-        else:
-            # Split into chunks
-            for i in range(0, len(escaped_content), max_length):
-                chunk = escaped_content[i : i + max_length]
-                await update.message.reply_text(chunk)
-
-        logger.info(
-            "Chat message processed successfully",
-            telegram_id=telegram_id,
-            provider=provider,
-            tokens_used=response.tokens_used,
-        )
+            # Escape markdown characters in AI response
+            escaped_content = escape_markdown(response.content)
+
+            # Split response if it's too long (Telegram limit: 4096 characters)
+            max_length = 4096
+            if len(escaped_content) <= max_length:
+                await update.message.reply_text(escaped_content)
+            else:
+                # Split into chunks
+                for i in range(0, len(escaped_content), max_length):
+                    chunk = escaped_content[i : i + max_length]
+                    await update.message.reply_text(chunk)
+
+            logger.info(
+                "Chat message processed successfully",
+                telegram_id=telegram_id,
+                provider=provider,
+                tokens_used=response.tokens_used,
+            )
 
-    except Exception as e:
-        logger.error(
-            "Error processing chat message",
-            telegram_id=telegram_id,
-            provider=provider,
-            error=str(e),
-        )
-        await update.message.reply_text(
-            f"Sorry, I encountered an error: {escape_markdown(str(e))}\n"
-            "Please try again later or use /new to start a fresh conversation."
-        )
+        except Exception as e:
+            logger.error(
+                "Error processing chat message",
+                telegram_id=telegram_id,
+                provider=provider,
+                error=str(e),
+            )
+            await update.message.reply_text(
+                f"Sorry, I encountered an error: {escape_markdown(str(e))}\n"
+                "Please try again later or use /new to start a fresh conversation."
+            )
 
 
 @authorized_users_only
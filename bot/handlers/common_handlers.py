@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 import structlog
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -7,6 +7,7 @@ from bot.models.user import User
 from bot.services.conversation_service import ConversationService
 from bot.config import settings
 from bot.utils.auth import authorized_users_only
+from bot.utils.constants import MESSAGE_HELP, MESSAGE_WELCOME_TAIL
 
 logger = structlog.get_logger()
 
@@ -27,7 +28,7 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if db_user:
         # Update last active time
-        db_user.last_active = datetime.utcnow()
+        db_user.last_active = datetime.now(timezone.utc)
         await db_user.save()
         logger.info("Updated existing user", telegram_id=telegram_id)
     else:
@@ -43,22 +44,7 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         logger.info("Created new user", telegram_id=telegram_id)
 
     # Send welcome message
-    welcome_message = (
-        f"Hello {user.first_name}!\n\n"
-        "I'm Hermes, your AI assistant bot. I can connect you with both OpenAI and Anthropic Claude.\n\n"
-        "Available commands:\n"
-        "/chat <message> - Chat with default AI (Claude)\n"
-        "/chat_gpt <message> - Chat with OpenAI GPT\n"
-        "/chat_claude <message> - Chat with Anthropic Claude\n"
-        "/ticket <id> - Get Jira ticket summary (e.g., /ticket MS-1234)\n"
-        "/adw - Start AI-driven workflow on GitHub repo\n"
-        "/git - Manage repositories (add, list, remove)\n"
-        "/new - Start a new conversation\n"
-        "/help - Show this help message\n\n"
-        "Just send me a message using any of the chat commands!"
-    )
-
-    await update.message.reply_text(welcome_message)
+    await update.message.reply_text(f"Hello {user.first_name}{MESSAGE_WELCOME_TAIL}")
 
 
 @authorized_users_only
@@ -67,37 +53,7 @@ async def help_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     logger.info("Help command received", telegram_id=user.id)
 
-    help_message = (
-        "Hermes Bot - AI Assistant\n\n"
-        "Available commands:\n\n"
-        "/start - Initialize the bot\n"
-        "/help - Show this help message\n"
-        "/new - Start a new conversation session\n\n"
-        "Chat commands:\n"
-        "/chat <message> - Chat with default AI (Claude)\n"
-        "/chat_gpt <message> - Chat with OpenAI GPT-4\n"
-        "/chat_claude <message> - Chat with Anthropic Claude\n\n"
-        "Jira integration:\n"
-        "/ticket <id> - Get AI summary of Jira ticket\n"
-        "Example: /ticket MS-1234\n\n"
-        "Repository Management:\n"
-        "/git add <short_name> <jira_prefix> <repo_url>\n"
-        "Example: /git add backend MS EcorRouge/backend-api\n"
-        "/git list - Show all your registered repositories\n"
-        "/git remove <short_name>\n"
-        "Example: /git remove backend\n\n"
-        "AI-Driven Workflows:\n"
-        "/adw [workflow:name] [repo:owner/repo] <task> [JIRA-ID]\n"
-        "Example: /adw repo:myorg/myrepo Fix login bug MS-1234\n\n"
-        "Chat examples:\n"
-        "/chat Hello, how are you?\n"
-        "/chat_gpt What is the capital of France?\n"
-        "/chat_claude Explain quantum computing\n\n"
-        "The bot maintains conversation context, so follow-up messages "
-        "will remember previous messages in the same session."
-    )
-
-    await update.message.reply_text(help_message)
+    await update.message.reply_text(MESSAGE_HELP)
 
 
 @authorized_users_only
@@ -115,10 +71,11 @@ async def new_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     db_user = await User.find_one(User.telegram_id == telegram_id)
     provider = db_user.default_provider if db_user else settings.default_ai_provider
 
-    # Start new conversation
-    conversation = await ConversationService.start_new_conversation(
-        telegram_id, provider
-    )
+    # Start new conversation once the user's in-flight chat turns are done
+    async with ConversationService.user_lock(telegram_id):
+        conversation = await ConversationService.start_new_conversation(
+            telegram_id, provider
+        )
 
     await update.message.reply_text(
         f"Started a new conversation session.\n"
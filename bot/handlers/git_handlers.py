@@ -1,12 +1,21 @@
+import asyncio
 import structlog
+import time
 import uuid
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from beanie import PydanticObjectId
+from beanie.operators import Set
+from pymongo.errors import DuplicateKeyError
 from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.constants import ChatAction
+from telegram.error import BadRequest
 
-from bot.models.repository import Repository
-from bot.services.git_parser import GitCommandParser
+from bot.clients import HTTPClients
+from bot.models.repository import Repository, RepositoryListView
+from bot.services.git_parser import GitCommandParser, ParsedGitCommand
 from bot.services.redis_service import RedisService
 from bot.config import settings
 from bot.utils.auth import authorized_users_only
@@ -15,16 +24,157 @@ from bot.utils.constants import escape_markdown
 logger = structlog.get_logger()
 
 
+# LRU cache of parsed /git commands keyed by normalized command text
+_PARSE_CACHE_SIZE = 512
+_parse_cache: OrderedDict[str, ParsedGitCommand] = OrderedDict()
+
+# /git list page size; keeps each reply well under Telegram's 4096-char limit
+_LIST_PAGE_SIZE = 20
+
+# /git list output templates
+_LIST_HEADER = "📋 *Your Registered Repositories*\n\n"
+_LIST_ROW = (
+    "━━━━━━━━━━━━━━━━━━\n"
+    "*{name}*\n"
+    "Repository: {url}\n"
+    "Jira Prefix: {jp}\n"
+    "Status: {rs}\n"
+    "Prime: {ps}\n"
+)
+
+# /git add and /git remove reply templates; values are Markdown-escaped
+_ADD_REPLY = (
+    "🔄 *Adding Repository*\n\n"
+    "*Short Name:* {short_name}\n"
+    "*Jira Prefix:* {jira_prefix}\n"
+    "*Repository:* {repo_url}\n\n"
+    "I'll clone the repository and prime it with Claude Code. You'll be notified when complete."
+)
+_REMOVE_REPLY = (
+    "🗑️ *Removing Repository*\n\n"
+    "*Short Name:* {short_name}\n"
+    "*Repository:* {repo_url}\n\n"
+    "⚠️ This action is permanent. The repository record has been deleted and the filesystem cleanup is in progress.\n\n"
+    "You'll be notified when the cleanup is complete."
+)
+_PRIME_OUTPUT_LIMIT = 1000
+_PRIME_OUTPUT_BLOCK = "\n\n*Prime Output:*\n```\n{output}\n```"
+
+# Git responses waiting to be sent, per user; bursts are merged into one
+# message as long as it fits Telegram's limit
+_REPLY_FLUSH_INTERVAL = 0.5
+_TELEGRAM_MAX_LEN = 4096
+_pending_replies: dict[int, list[str]] = {}
+
+# Short-lived cache of (telegram_id, short_name) -> (fetched_at, Repository)
+_REPO_CACHE_TTL = 10
+_repo_cache: dict[tuple[int, str], tuple[float, Repository | None]] = {}
+
 # Global Redis service instance (shared with adw_handlers)
 redis_service: RedisService = None
 
 
 def set_redis_service(service: RedisService):
-    """Set the global Redis service instance."""
+    """
+    Set the global Redis service instance.
+
+    Raises:
+        ValueError: If service is None
+    """
+    if service is None:
+        raise ValueError("Redis service is required")
     global redis_service
     redis_service = service
 
 
+@lru_cache(maxsize=1)
+def _get_parser() -> GitCommandParser:
+    """Return the shared GitCommandParser so its OpenAI client is reused."""
+    return GitCommandParser(
+        api_key=settings.openai_api_key,
+        http_client=HTTPClients.openai,
+    )
+
+
+async def _parse_cached(message_text: str) -> ParsedGitCommand:
+    """
+    Parse a git command, reusing results for repeated command strings.
+
+    Whitespace is normalized before lookup; case is kept because short
+    names and repository paths are case-sensitive. Failed parses are not
+    cached.
+
+    Args:
+        message_text: The text after /git command
+
+    Returns:
+        Parsed command data
+    """
+    key = " ".join(message_text.split())
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        _parse_cache.move_to_end(key)
+        return cached
+
+    parsed = await _get_parser().parse(message_text)
+    if not parsed.error:
+        _parse_cache[key] = parsed
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return parsed
+
+
+async def _get_repo(telegram_id: int, short_name: str) -> Repository | None:
+    """
+    Look up a user's repository by short name with a short TTL cache.
+
+    Args:
+        telegram_id: User's Telegram ID
+        short_name: Repository short name
+
+    Returns:
+        Repository if found, None otherwise
+    """
+    key = (telegram_id, short_name)
+    cached = _repo_cache.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < _REPO_CACHE_TTL:
+        return cached[1]
+
+    repo = await Repository.find_one(
+        Repository.telegram_id == telegram_id,
+        Repository.short_name == short_name
+    )
+    _repo_cache[key] = (now, repo)
+    return repo
+
+
+def _on_publish_done(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, log, failure_text: str
+):
+    """
+    Build a done-callback for a background task publish.
+
+    Logs the outcome and sends a follow-up message if the task could not
+    be queued.
+
+    Args:
+        update: Telegram update to reply to on failure
+        context: Telegram context, whose application owns the reply task
+        log: Logger bound with the task context
+        failure_text: Message sent to the user if publishing failed
+    """
+    def callback(publish: asyncio.Task):
+        if not publish.cancelled() and publish.exception() is None and publish.result():
+            log.info("Task queued")
+            return
+
+        log.error("Failed to queue task")
+        context.application.create_task(update.message.reply_text(failure_text))
+
+    return callback
+
+
 @authorized_users_only
 async def git_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
@@ -43,9 +193,10 @@ async def git_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     user = update.effective_user
     telegram_id = user.id
+    log = logger.bind(telegram_id=telegram_id)
 
     # Extract command text
-    message_text = update.message.text.replace("/git", "", 1).strip()
+    message_text = " ".join(context.args)
 
     if not message_text:
         await update.message.reply_text(
@@ -62,60 +213,69 @@ async def git_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    logger.info(
-        "Processing git command",
-        telegram_id=telegram_id,
-        message_text=message_text
-    )
+    log.info("Processing git command", message_text=message_text)
 
-    # Show typing indicator
-    await update.message.chat.send_action(ChatAction.TYPING)
+    # Show typing indicator without blocking on the Telegram round-trip
+    context.application.create_task(
+        update.message.chat.send_action(ChatAction.TYPING)
+    )
 
     try:
         # Parse command using OpenAI
-        parser = GitCommandParser(api_key=settings.openai_api_key)
-        parsed = await parser.parse(message_text)
-
-        operation = parsed.get("operation")
-
-        if operation == "add":
-            await handle_add(update, telegram_id, parsed)
-        elif operation == "list":
-            await handle_list(update, telegram_id, parsed)
-        elif operation == "remove":
-            await handle_remove(update, telegram_id, parsed)
-        else:
-            error_msg = parsed.get("error", "Could not determine git operation")
-            await update.message.reply_text(
-                f"❌ Invalid command: {escape_markdown(error_msg)}\n\n"
-                "Please use:\n"
-                "  /git add <short_name> <jira_prefix> <repo_url>\n"
-                "  /git list\n"
-                "  /git remove <short_name>"
-            )
+        parsed = await _parse_cached(message_text)
+
+        handler = _GIT_OPS.get(parsed.operation, _handle_invalid)
+        await handler(update, context, telegram_id, parsed)
 
     except Exception as e:
-        logger.error(
-            "Error processing git command",
-            telegram_id=telegram_id,
-            error=str(e)
-        )
+        log.error("Error processing git command", error=str(e))
         await update.message.reply_text(
             f"Sorry, I encountered an error:\n{escape_markdown(str(e))}"
         )
 
 
-async def handle_add(update: Update, telegram_id: int, parsed: dict):
+async def _handle_invalid(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    telegram_id: int,
+    parsed: ParsedGitCommand,
+):
+    """
+    Reply to a command whose operation could not be determined.
+
+    Args:
+        update: Telegram update
+        context: Telegram context
+        telegram_id: User's Telegram ID
+        parsed: Parsed command data
+    """
+    error_msg = parsed.error or "Could not determine git operation"
+    await update.message.reply_text(
+        f"❌ Invalid command: {escape_markdown(error_msg)}\n\n"
+        "Please use:\n"
+        "  /git add <short_name> <jira_prefix> <repo_url>\n"
+        "  /git list\n"
+        "  /git remove <short_name>"
+    )
+
+
+async def handle_add(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    telegram_id: int,
+    parsed: ParsedGitCommand,
+):
     """
     Handle git add operation.
 
     Args:
         update: Telegram update
+        context: Telegram context
         telegram_id: User's Telegram ID
         parsed: Parsed command data
     """
     # Validate parsed data
-    is_valid, error_msg = GitCommandParser.validate_add_data(parsed)
+    is_valid, error_msg = GitCommandParser.validate(parsed, "add")
     if not is_valid:
         await update.message.reply_text(
             f"❌ Invalid add command: {escape_markdown(error_msg)}\n\n"
@@ -124,15 +284,13 @@ async def handle_add(update: Update, telegram_id: int, parsed: dict):
         )
         return
 
-    short_name = parsed["short_name"]
-    jira_prefix = parsed["jira_prefix"].upper()
-    repo_url = parsed["repo_url"]
+    short_name = parsed.short_name
+    jira_prefix = parsed.jira_prefix.upper()
+    repo_url = parsed.repo_url
+    log = logger.bind(telegram_id=telegram_id, short_name=short_name)
 
     # Check if repository with same short_name already exists for this user
-    existing = await Repository.find_one(
-        Repository.telegram_id == telegram_id,
-        Repository.short_name == short_name
-    )
+    existing = await _get_repo(telegram_id, short_name)
 
     if existing:
         await update.message.reply_text(
@@ -144,7 +302,14 @@ async def handle_add(update: Update, telegram_id: int, parsed: dict):
         return
 
     # Normalize repo URL
-    short_form, full_url = GitCommandParser.normalize_repo_url(repo_url)
+    try:
+        short_form, full_url = GitCommandParser.normalize_repo_url(repo_url)
+    except ValueError:
+        await update.message.reply_text(
+            f"❌ Invalid repository URL: {escape_markdown(repo_url)}\n\n"
+            "Use owner/repo or https://github.com/owner/repo"
+        )
+        return
 
     # Create repository record
     repo = Repository(
@@ -153,73 +318,74 @@ async def handle_add(update: Update, telegram_id: int, parsed: dict):
         jira_prefix=jira_prefix,
         repo_url=short_form,
         full_url=full_url,
+        escaped_short_name=escape_markdown(short_name),
+        escaped_repo_url=escape_markdown(short_form),
+        escaped_jira_prefix=escape_markdown(jira_prefix),
         registered=False,
         primed=False
     )
 
-    # Save to database
-    await repo.insert()
+    # Save to database; the unique index catches a concurrent add of the
+    # same short name that slipped past the check above
+    try:
+        await repo.insert()
+    except DuplicateKeyError:
+        await update.message.reply_text(
+            f"❌ Repository with short name '{escape_markdown(short_name)}' already exists."
+        )
+        return
+    finally:
+        _repo_cache.pop((telegram_id, short_name), None)
 
-    logger.info(
-        "Repository saved to database",
-        telegram_id=telegram_id,
-        short_name=short_name,
-        repo_url=short_form
-    )
+    log.info("Repository saved to database", repo_url=short_form)
 
     # Send add task to worker (clone + prime)
-    if redis_service:
-        task_id = str(uuid.uuid4())
-        task_data = {
-            "task_id": task_id,
-            "telegram_id": telegram_id,
-            "operation": "git_add",
-            "repo_id": str(repo.id),
-            "short_name": short_name,
-            "repo_url": short_form,
-            "full_url": full_url,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-        success = await redis_service.publish_task(task_data)
-
-        if success:
-            await update.message.reply_text(
-                f"🔄 *Adding Repository*\n\n"
-                f"*Short Name:* {escape_markdown(short_name)}\n"
-                f"*Jira Prefix:* {escape_markdown(jira_prefix)}\n"
-                f"*Repository:* {escape_markdown(short_form)}\n\n"
-                f"I'll clone the repository and prime it with Claude Code. You'll be notified when complete.",
-                parse_mode="Markdown"
-            )
+    task_id = uuid.uuid4().hex
+    task_data = {
+        "task_id": task_id,
+        "telegram_id": telegram_id,
+        "operation": "git_add",
+        "repo_id": str(repo.id),
+        "short_name": short_name,
+        "repo_url": short_form,
+        "full_url": full_url
+    }
+
+    publish = redis_service.publish_task_async(task_data)
+    publish.add_done_callback(_on_publish_done(
+        update,
+        context,
+        log.bind(task_id=task_id),
+        "❌ Failed to queue add task. Repository saved but not processed yet."
+    ))
 
-            logger.info(
-                "Add task queued",
-                task_id=task_id,
-                telegram_id=telegram_id,
-                short_name=short_name
-            )
-        else:
-            await update.message.reply_text(
-                "Failed to queue add task. Repository saved but not processed yet."
-            )
-    else:
-        await update.message.reply_text(
-            "Worker service is not available. Repository saved but not processed yet."
-        )
+    await update.message.reply_text(
+        _ADD_REPLY.format(
+            short_name=repo.escaped_short_name,
+            jira_prefix=repo.escaped_jira_prefix,
+            repo_url=repo.escaped_repo_url
+        ),
+        parse_mode="Markdown"
+    )
 
 
-async def handle_list(update: Update, telegram_id: int, parsed: dict):
+async def handle_list(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    telegram_id: int,
+    parsed: ParsedGitCommand,
+):
     """
     Handle git list operation.
 
     Args:
         update: Telegram update
+        context: Telegram context
         telegram_id: User's Telegram ID
         parsed: Parsed command data
     """
     # Validate parsed data
-    is_valid, error_msg = GitCommandParser.validate_list_data(parsed)
+    is_valid, error_msg = GitCommandParser.validate(parsed, "list")
     if not is_valid:
         await update.message.reply_text(
             f"❌ Invalid list command: {escape_markdown(error_msg)}\n\n"
@@ -227,8 +393,30 @@ async def handle_list(update: Update, telegram_id: int, parsed: dict):
         )
         return
 
-    # Find all repositories for this user
-    repos = await Repository.find(Repository.telegram_id == telegram_id).to_list()
+    try:
+        page = max(int(parsed.page or 1), 1)
+    except (TypeError, ValueError):
+        page = 1
+
+    # Fetch one page of list fields only (skips prime_output); one extra
+    # row tells us whether there is a next page
+    repos = await Repository.find(
+        Repository.telegram_id == telegram_id,
+        projection_model=RepositoryListView
+    ).sort(+Repository.short_name).skip(
+        (page - 1) * _LIST_PAGE_SIZE
+    ).limit(_LIST_PAGE_SIZE + 1).to_list()
+
+    has_more = len(repos) > _LIST_PAGE_SIZE
+    repos = repos[:_LIST_PAGE_SIZE]
+
+    if not repos and page > 1:
+        await update.message.reply_text(
+            f"📋 No repositories on page {page}.\n\n"
+            "Use `/git list` to see the first page.",
+            parse_mode="Markdown"
+        )
+        return
 
     if not repos:
         await update.message.reply_text(
@@ -239,54 +427,59 @@ async def handle_list(update: Update, telegram_id: int, parsed: dict):
         )
         return
 
-    # Format repository list
-    response_lines = ["📋 *Your Registered Repositories*\n"]
-
-    for repo in repos:
-        response_lines.append(f"━━━━━━━━━━━━━━━━━━")
-        response_lines.append(f"*{escape_markdown(repo.short_name)}*")
-        response_lines.append(f"Repository: {escape_markdown(repo.repo_url)}")
-        response_lines.append(f"Jira Prefix: {escape_markdown(repo.jira_prefix)}")
-
-        # Status
-        if repo.registered:
-            reg_status = "✅ Registered"
-        else:
-            reg_status = "⏳ Pending"
-        response_lines.append(f"Status: {reg_status}")
-
-        if repo.primed:
-            prime_status = "✅ Primed"
-            if repo.last_primed:
-                prime_status += f" ({repo.last_primed.strftime('%Y-%m-%d %H:%M')} UTC)"
-        else:
-            prime_status = "❌ Not Primed"
-        response_lines.append(f"Prime: {prime_status}")
-        response_lines.append("")
+    # Format repository list (older records predate the escaped_* fields)
+    rows = "\n".join(
+        _LIST_ROW.format(
+            name=repo.escaped_short_name or escape_markdown(repo.short_name),
+            url=repo.escaped_repo_url or escape_markdown(repo.repo_url),
+            jp=repo.escaped_jira_prefix or escape_markdown(repo.jira_prefix),
+            rs=_reg_status(repo),
+            ps=_prime_status(repo)
+        )
+        for repo in repos
+    )
+
+    footer = f"\nMore: `/git list {page + 1}`" if has_more else ""
 
     await update.message.reply_text(
-        "\n".join(response_lines),
+        _LIST_HEADER + rows + footer,
         parse_mode="Markdown"
     )
 
-    logger.info(
-        "Listed repositories",
-        telegram_id=telegram_id,
-        count=len(repos)
-    )
+    logger.bind(telegram_id=telegram_id).info("Listed repositories", count=len(repos), page=page)
 
 
-async def handle_remove(update: Update, telegram_id: int, parsed: dict):
+def _reg_status(repo: RepositoryListView) -> str:
+    """Format the registration status of a repository."""
+    return "✅ Registered" if repo.registered else "⏳ Pending"
+
+
+def _prime_status(repo: RepositoryListView) -> str:
+    """Format the prime status of a repository."""
+    if not repo.primed:
+        return "❌ Not Primed"
+    if repo.last_primed:
+        return f"✅ Primed ({repo.last_primed.strftime('%Y-%m-%d %H:%M')} UTC)"
+    return "✅ Primed"
+
+
+async def handle_remove(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    telegram_id: int,
+    parsed: ParsedGitCommand,
+):
     """
     Handle git remove operation.
 
     Args:
         update: Telegram update
+        context: Telegram context
         telegram_id: User's Telegram ID
         parsed: Parsed command data
     """
     # Validate parsed data
-    is_valid, error_msg = GitCommandParser.validate_remove_data(parsed)
+    is_valid, error_msg = GitCommandParser.validate(parsed, "remove")
     if not is_valid:
         await update.message.reply_text(
             f"❌ Invalid remove command: {escape_markdown(error_msg)}\n\n"
@@ -295,13 +488,11 @@ async def handle_remove(update: Update, telegram_id: int, parsed: dict):
         )
         return
 
-    short_name = parsed["short_name"]
+    short_name = parsed.short_name
+    log = logger.bind(telegram_id=telegram_id, short_name=short_name)
 
     # Check if repository exists for this user
-    repo = await Repository.find_one(
-        Repository.telegram_id == telegram_id,
-        Repository.short_name == short_name
-    )
+    repo = await _get_repo(telegram_id, short_name)
 
     if not repo:
         await update.message.reply_text(
@@ -315,56 +506,49 @@ async def handle_remove(update: Update, telegram_id: int, parsed: dict):
     repo_id = str(repo.id)
     repo_url = repo.repo_url
     await repo.delete()
+    _repo_cache.pop((telegram_id, short_name), None)
 
-    logger.info(
-        "Repository deleted from database",
-        telegram_id=telegram_id,
-        short_name=short_name,
-        repo_id=repo_id
-    )
+    log.info("Repository deleted from database", repo_id=repo_id)
 
     # Queue task to worker to remove filesystem directory
-    if redis_service:
-        task_id = str(uuid.uuid4())
-        task_data = {
-            "task_id": task_id,
-            "telegram_id": telegram_id,
-            "operation": "git_remove",
-            "repo_id": repo_id,
-            "short_name": short_name,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-        success = await redis_service.publish_task(task_data)
-
-        if success:
-            await update.message.reply_text(
-                f"🗑️ *Removing Repository*\n\n"
-                f"*Short Name:* {escape_markdown(short_name)}\n"
-                f"*Repository:* {escape_markdown(repo_url)}\n\n"
-                f"⚠️ This action is permanent. The repository record has been deleted and the filesystem cleanup is in progress.\n\n"
-                f"You'll be notified when the cleanup is complete.",
-                parse_mode="Markdown"
-            )
+    task_id = uuid.uuid4().hex
+    task_data = {
+        "task_id": task_id,
+        "telegram_id": telegram_id,
+        "operation": "git_remove",
+        "repo_id": repo_id,
+        "short_name": short_name
+    }
+
+    publish = redis_service.publish_task_async(task_data)
+    publish.add_done_callback(_on_publish_done(
+        update,
+        context,
+        log.bind(task_id=task_id),
+        "⚠️ Failed to queue filesystem cleanup task. The directory may still exist on the worker."
+    ))
 
-            logger.info(
-                "Remove task queued",
-                task_id=task_id,
-                telegram_id=telegram_id,
-                short_name=short_name
-            )
-        else:
-            await update.message.reply_text(
-                f"✅ Repository '{escape_markdown(short_name)}' deleted from database.\n\n"
-                "⚠️ Failed to queue filesystem cleanup task. The directory may still exist on the worker.",
-                parse_mode="Markdown"
-            )
-    else:
-        await update.message.reply_text(
-            f"✅ Repository '{escape_markdown(short_name)}' deleted from database.\n\n"
-            "⚠️ Worker service is not available. The directory may still exist on the worker.",
-            parse_mode="Markdown"
-        )
+    await update.message.reply_text(
+        _REMOVE_REPLY.format(
+            short_name=escape_markdown(short_name),
+            repo_url=escape_markdown(repo_url)
+        ),
+        parse_mode="Markdown"
+    )
+
+
+# /git operation -> handler
+_GIT_OPS = {
+    "add": handle_add,
+    "list": handle_list,
+    "remove": handle_remove,
+}
+
+# Worker response status -> message prefix
+_STATUS_PREFIX = {
+    "success": "✅ ",
+    "failed": "❌ ",
+}
 
 
 async def handle_git_response(response_data: dict, application):
@@ -384,22 +568,28 @@ async def handle_git_response(response_data: dict, application):
         repo_id = response_data.get("repo_id")
         prime_output = response_data.get("prime_output")
 
-        if not all([task_id, telegram_id, status]):
+        if not (task_id and telegram_id and status):
             logger.warning("Incomplete git response", data=response_data)
             return
 
         # Update repository status if add (clone + prime) succeeded
         if operation == "git_add" and status == "success" and repo_id:
             try:
-                repo = await Repository.get(repo_id)
-                if repo:
-                    repo.registered = True
-                    repo.primed = True
-                    repo.last_primed = datetime.utcnow()
-                    if prime_output:
-                        repo.prime_output = prime_output
-                    repo.update_timestamp()
-                    await repo.save()
+                now = datetime.now(timezone.utc)
+                fields = {
+                    Repository.registered: True,
+                    Repository.primed: True,
+                    Repository.last_primed: now,
+                    Repository.updated_at: now,
+                }
+                if prime_output:
+                    fields[Repository.prime_output] = prime_output
+
+                # Single partial update instead of fetching and re-saving the document
+                result = await Repository.find_one(
+                    Repository.id == PydanticObjectId(repo_id)
+                ).update(Set(fields))
+                if result and result.modified_count:
                     logger.info("Updated repository add status", repo_id=repo_id)
             except Exception as e:
                 logger.error("Failed to update repository status", error=str(e))
@@ -407,27 +597,19 @@ async def handle_git_response(response_data: dict, application):
         print(f"git response: {operation}, status={status}, output={prime_output}")
 
         # Format message based on status with escaped dynamic values
-        if status == "success":
-            text = f"✅ {escape_markdown(message)}"
-            # Include prime output if available
-            if prime_output:
-                text += f"\n\n*Prime Output:*\n```\n{escape_markdown(prime_output[:1000])}\n```"
-                if len(prime_output) > 1000:
-                    text += "\n_(Output truncated)_"
-        elif status == "failed":
-            text = f"❌ {escape_markdown(message)}"
-        else:
-            text = f"ℹ️ {escape_markdown(message)}"
-
-        # Send message to user
-        await application.bot.send_message(
-            chat_id=telegram_id,
-            text=text,
-            parse_mode="Markdown"
-        )
+        text = _STATUS_PREFIX.get(status, "ℹ️ ") + escape_markdown(message)
+        # Include prime output if available
+        if status == "success" and prime_output:
+            text += _PRIME_OUTPUT_BLOCK.format(
+                output=escape_markdown(prime_output[:_PRIME_OUTPUT_LIMIT])
+            )
+            if len(prime_output) > _PRIME_OUTPUT_LIMIT:
+                text += "\n_(Output truncated)_"
+
+        _queue_reply(application, telegram_id, text)
 
         logger.info(
-            "Sent git response to user",
+            "Queued git response for user",
             task_id=task_id,
             telegram_id=telegram_id,
             status=status
@@ -435,3 +617,99 @@ async def handle_git_response(response_data: dict, application):
 
     except Exception as e:
         logger.error("Error handling git response", error=str(e), data=response_data)
+
+
+def _queue_reply(application, telegram_id: int, text: str):
+    """
+    Queue a message for a user, starting a flush task if none is running.
+
+    Args:
+        application: Telegram application instance
+        telegram_id: Recipient's Telegram ID
+        text: Markdown-formatted message
+    """
+    pending = _pending_replies.get(telegram_id)
+    if pending is not None:
+        pending.append(text)
+        return
+
+    _pending_replies[telegram_id] = [text]
+    application.create_task(_flush_replies(application, telegram_id))
+
+
+def _take_batch(pending: list[str]) -> list[str]:
+    """
+    Pop as many queued messages as fit into one Telegram message.
+
+    Args:
+        pending: Queued messages, oldest first
+
+    Returns:
+        Messages to send together, oldest first
+    """
+    batch = [pending.pop(0)]
+    size = len(batch[0])
+    while pending and size + 2 + len(pending[0]) <= _TELEGRAM_MAX_LEN:
+        size += 2 + len(pending[0])
+        batch.append(pending.pop(0))
+    return batch
+
+
+async def _send_batch(application, telegram_id: int, batch: list[str]):
+    """
+    Send queued messages as one Markdown message, degrading on bad markup.
+
+    If Telegram rejects the merged message, each message is sent on its
+    own so one bad entity only affects itself, and any message still
+    rejected is sent as plain text.
+
+    Args:
+        application: Telegram application instance
+        telegram_id: Recipient's Telegram ID
+        batch: Markdown-formatted messages
+    """
+    bot = application.bot
+    try:
+        await bot.send_message(
+            chat_id=telegram_id,
+            text="\n\n".join(batch),
+            parse_mode="Markdown"
+        )
+        return
+    except BadRequest as e:
+        if len(batch) == 1:
+            logger.warning("Markdown rejected, sending plain text", telegram_id=telegram_id, error=str(e))
+            await bot.send_message(chat_id=telegram_id, text=batch[0])
+            return
+        logger.warning("Merged git response rejected, sending separately", telegram_id=telegram_id, error=str(e))
+
+    for text in batch:
+        try:
+            await bot.send_message(chat_id=telegram_id, text=text, parse_mode="Markdown")
+        except BadRequest as e:
+            logger.warning("Markdown rejected, sending plain text", telegram_id=telegram_id, error=str(e))
+            await bot.send_message(chat_id=telegram_id, text=text)
+
+
+async def _flush_replies(application, telegram_id: int):
+    """
+    Send queued messages for a user, merging those that arrive in a burst.
+
+    The first message goes out immediately; anything queued while it is in
+    flight or within the flush interval is sent together in the next call.
+
+    Args:
+        application: Telegram application instance
+        telegram_id: Recipient's Telegram ID
+    """
+    pending = _pending_replies[telegram_id]
+    try:
+        while pending:
+            batch = _take_batch(pending)
+            try:
+                await _send_batch(application, telegram_id, batch)
+            except Exception as e:
+                logger.error("Failed to send git response", telegram_id=telegram_id, error=str(e))
+            await asyncio.sleep(_REPLY_FLUSH_INTERVAL)
+    finally:
+        del _pending_replies[telegram_id]
@@ -1,9 +1,12 @@
+import asyncio
 import structlog
 import re
+from functools import lru_cache
 from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.constants import ChatAction
 
+from bot.clients import HTTPClients
 from bot.services.jira_service import JiraService
 from bot.services.openai_service import OpenAIService
 from bot.config import settings
@@ -12,6 +15,39 @@ from bot.utils.constants import escape_markdown
 
 logger = structlog.get_logger()
 
+# Jira ticket ID format: PROJECT-NUMBER
+_TICKET_RE = re.compile(r"^[A-Z]+-\d+$")
+
+# /ticket reply template; all values are Markdown-escaped before formatting
+_TICKET_REPLY = (
+    "🎫 *{key}*: {summary}\n\n"
+    "📊 *Status:* {status}\n"
+    "⚡ *Priority:* {priority}\n"
+    "👤 *Assignee:* {assignee}\n"
+    "🔗 [View in Jira]({url})\n\n"
+    "*AI Summary:*\n{ai_summary}"
+)
+
+
+@lru_cache(maxsize=1)
+def _get_jira_service() -> JiraService:
+    """Return the shared JiraService instance."""
+    return JiraService(
+        jira_url=settings.jira_url,
+        email=settings.jira_email,
+        api_token=settings.jira_api_token,
+        session=HTTPClients.jira,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_ai_service() -> OpenAIService:
+    """Return the shared OpenAIService so its HTTP client pool stays warm."""
+    return OpenAIService(
+        api_key=settings.openai_api_key,
+        http_client=HTTPClients.openai,
+    )
+
 
 @authorized_users_only
 async def ticket_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -25,7 +61,7 @@ async def ticket_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     telegram_id = user.id
 
     # Extract ticket ID from command
-    message_text = update.message.text.replace("/ticket", "", 1).strip()
+    message_text = " ".join(context.args)
 
     if not message_text:
         await update.message.reply_text(
@@ -36,32 +72,29 @@ async def ticket_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Validate ticket ID format (PROJECT-NUMBER)
     ticket_id = message_text.strip().upper()
-    if not re.match(r"^[A-Z]+-\d+$", ticket_id):
+    if not _TICKET_RE.match(ticket_id):
         await update.message.reply_text(
             f"Invalid ticket ID format: {escape_markdown(ticket_id)}\n"
             "Expected format: PROJECT-NUMBER (e.g., MS-1234)"
         )
         return
 
-    logger.info(
-        "Processing ticket request",
-        telegram_id=telegram_id,
-        ticket_id=ticket_id,
-    )
+    log = logger.bind(telegram_id=telegram_id, ticket_id=ticket_id)
+    log.info("Processing ticket request")
 
-    # Show typing indicator
-    await update.message.chat.send_action(ChatAction.TYPING)
+    # Show typing indicator without blocking on the Telegram round-trip
+    context.application.create_task(
+        update.message.chat.send_action(ChatAction.TYPING)
+    )
 
     try:
-        # Initialize Jira service
-        jira_service = JiraService(
-            jira_url=settings.jira_url,
-            email=settings.jira_email,
-            api_token=settings.jira_api_token,
-        )
+        ai_service = _get_ai_service()
 
-        # Fetch ticket details
-        issue = await jira_service.get_issue(ticket_id)
+        # Fetch ticket details while the OpenAI connection warms up
+        issue, _ = await asyncio.gather(
+            _get_jira_service().get_issue(ticket_id),
+            ai_service.warmup(),
+        )
 
         if not issue:
             await update.message.reply_text(
@@ -74,8 +107,6 @@ async def ticket_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         ticket_details = _format_ticket_for_summary(issue)
 
         # Use OpenAI to generate summary
-        ai_service = OpenAIService(api_key=settings.openai_api_key)
-
         prompt = (
             "Please provide a brief, clear summary of this Jira ticket. "
             "Include the key points, current status, and any important details. "
@@ -86,13 +117,14 @@ async def ticket_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         response = await ai_service.send_message(prompt, [])
 
         # Format final response with escaped dynamic values
-        response_text = (
-            f"🎫 *{escape_markdown(issue['key'])}*: {escape_markdown(issue['summary'])}\n\n"
-            f"📊 *Status:* {escape_markdown(issue['status'])}\n"
-            f"⚡ *Priority:* {escape_markdown(issue['priority'])}\n"
-            f"👤 *Assignee:* {escape_markdown(issue['assignee'])}\n"
-            f"🔗 [View in Jira]({issue['url']})\n\n"
-            f"*AI Summary:*\n{escape_markdown(response.content)}"
+        response_text = _TICKET_REPLY.format(
+            key=escape_markdown(issue["key"]),
+            summary=escape_markdown(issue["summary"]),
+            status=escape_markdown(issue["status"]),
+            priority=escape_markdown(issue["priority"]),
+            assignee=escape_markdown(issue["assignee"]),
+            url=issue["url"],
+            ai_summary=escape_markdown(response.content),
         )
 
         await update.message.reply_text(
@@ -101,20 +133,10 @@ async def ticket_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             disable_web_page_preview=True,
         )
 
-        logger.info(
-            "Ticket request processed successfully",
-            telegram_id=telegram_id,
-            ticket_id=ticket_id,
-            tokens_used=response.tokens_used,
-        )
+        log.info("Ticket request processed successfully", tokens_used=response.tokens_used)
 
     except Exception as e:
-        logger.error(
-            "Error processing ticket request",
-            telegram_id=telegram_id,
-            ticket_id=ticket_id,
-            error=str(e),
-        )
+        log.error("Error processing ticket request", error=str(e))
         await update.message.reply_text(
             f"Sorry, I encountered an error while fetching ticket {escape_markdown(ticket_id)}:\n"
             f"{escape_markdown(str(e))}\n\n"
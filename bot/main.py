@@ -1,8 +1,15 @@
 import asyncio
 import signal
 import structlog
+from functools import wraps
 from telegram.ext import Application, CommandHandler
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+from bot.clients import HTTPClients
 from bot.config import settings
 from bot.database.mongodb import MongoDB
 from bot.utils.logger import setup_logging
@@ -12,12 +19,46 @@ from bot.handlers.ticket_handlers import ticket_handler
 from bot.handlers.error_handlers import error_handler
 from bot.handlers.adw_handlers import adw_handler, handle_worker_response, set_redis_service
 from bot.handlers.git_handlers import git_handler, set_redis_service as set_git_redis_service
+from bot.services.conversation_service import ConversationService
 from bot.services.redis_service import RedisService
 
 # Setup logging
 setup_logging()
 logger = structlog.get_logger()
 
+# Caps handlers that fan out to OpenAI/Jira/MongoDB/Redis
+_handler_sem = asyncio.Semaphore(settings.max_concurrent_handlers)
+
+
+def bounded(sem: asyncio.Semaphore):
+    """Decorator limiting how many invocations of a handler run at once."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with sem:
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# (command, callback, I/O-heavy). Heavy handlers are bounded by _handler_sem
+# and run with block=False. Updates are processed concurrently either way;
+# /new and chat turns are sequenced per user by ConversationService.user_lock.
+_HANDLERS = [
+    ("start", start_handler, False),
+    ("help", help_handler, False),
+    ("new", new_handler, False),
+    ("ticket", ticket_handler, True),
+    ("adw", adw_handler, True),
+    ("git", git_handler, True),
+    ("chat_gpt", chat_gpt_handler, True),
+    ("chat_claude", chat_claude_handler, True),
+    ("chat", chat_handler, True),
+]
+
 
 async def startup(application):
     """Initialize connections and services."""
@@ -32,11 +73,29 @@ async def startup(application):
     except Exception:
         db_name = settings.mongo_initdb_database
 
+    # Shared HTTP pools for OpenAI and Jira
+    await HTTPClients.open()
+
     # Connect to MongoDB
-    await MongoDB.connect(settings.mongodb_uri, db_name)
+    await MongoDB.connect(
+        settings.mongodb_uri,
+        db_name,
+        maxPoolSize=settings.mongo_max_pool_size,
+        minPoolSize=settings.mongo_min_pool_size,
+        maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+        waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,
+    )
+    ConversationService.start_writer(
+        batch_size=settings.message_batch_size,
+        flush_ms=settings.message_flush_ms,
+    )
 
     # Connect to Redis and start worker listener
-    redis_service = RedisService(settings.redis_url)
+    redis_service = RedisService(
+        settings.redis_url,
+        batch_size=settings.redis_batch_size,
+        flush_ms=settings.redis_flush_ms,
+    )
     await redis_service.connect()
 
     # Set the global Redis service for handlers
@@ -64,6 +123,8 @@ async def shutdown(application):
     if redis_service:
         await redis_service.disconnect()
 
+    await ConversationService.stop_writer()
+    await HTTPClients.close()
     await MongoDB.close()
     logger.info("Shutdown complete")
 
@@ -72,19 +133,25 @@ def main():
     """Main entry point for the bot."""
     logger.info("Initializing Hermes Bot", log_level=settings.log_level)
 
+    # Faster event loop; must be installed before the Application creates its loop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Create the Application
-    application = Application.builder().token(settings.telegram_api_key).build()
+    application = (
+        Application.builder()
+        .token(settings.telegram_api_key)
+        .concurrent_updates(True)
+        .build()
+    )
+    limit = bounded(_handler_sem)
 
     # Register command handlers (order matters - more specific first)
-    application.add_handler(CommandHandler("start", start_handler))
-    application.add_handler(CommandHandler("help", help_handler))
-    application.add_handler(CommandHandler("new", new_handler))
-    application.add_handler(CommandHandler("ticket", ticket_handler))
-    application.add_handler(CommandHandler("adw", adw_handler))
-    application.add_handler(CommandHandler("git", git_handler))
-    application.add_handler(CommandHandler("chat_gpt", chat_gpt_handler))
-    application.add_handler(CommandHandler("chat_claude", chat_claude_handler))
-    application.add_handler(CommandHandler("chat", chat_handler))
+    for name, callback, heavy in _HANDLERS:
+        if heavy:
+            application.add_handler(CommandHandler(name, limit(callback), block=False))
+        else:
+            application.add_handler(CommandHandler(name, callback))
 
     # Register error handler
     application.add_error_handler(error_handler)
@@ -95,10 +162,12 @@ def main():
 
     logger.info("Starting polling...")
 
-    # Run the bot with polling
+    # Run the bot with long polling (30 s server-side wait per getUpdates)
     application.run_polling(
         allowed_updates=["message", "callback_query"],
         drop_pending_updates=True,
+        timeout=30,
+        poll_interval=0,
     )
 
 
@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 import uuid
 
 from beanie import Document, Indexed
 from pydantic import Field
+from pymongo import IndexModel
 
 
 class Conversation(Document):
@@ -12,8 +13,8 @@ class Conversation(Document):
     telegram_id: Indexed(int)  # type: ignore
     provider: str  # "openai" or "claude"
     session_id: Indexed(str, unique=True) = Field(default_factory=lambda: str(uuid.uuid4()))  # type: ignore
-    started_at: datetime = Field(default_factory=datetime.utcnow)
-    last_message_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_message_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     message_count: int = 0
     is_active: bool = True
     metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -23,8 +24,14 @@ class Conversation(Document):
         indexes = [
             "telegram_id",
             "session_id",
-            [("telegram_id", 1), ("is_active", 1)],
-            [("telegram_id", 1), ("provider", 1), ("is_active", 1)],
+            # Only active conversations are indexed; also enforces one
+            # active conversation per user and provider
+            IndexModel(
+                [("telegram_id", 1), ("provider", 1)],
+                unique=True,
+                partialFilterExpression={"is_active": True},
+                name="one_active_per_user_provider",
+            ),
         ]
 
     class Config:
@@ -1,16 +1,19 @@
-from datetime import datetime
-from typing import Optional, Dict, Any
-from enum import Enum
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Literal
 
 from beanie import Document, Indexed
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 
-class MessageRole(str, Enum):
-    """Message role enum."""
+# Message role, stored as a plain string
+MessageRole = Literal["user", "assistant"]
 
-    USER = "user"
-    ASSISTANT = "assistant"
+
+class MessageBrief(BaseModel):
+    """Projection of Message with only the fields sent to the AI providers."""
+
+    role: MessageRole
+    content: str
 
 
 class Message(Document):
@@ -21,7 +24,7 @@ class Message(Document):
     role: MessageRole
     content: str
     provider: str  # "openai" or "claude"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     tokens_used: Optional[int] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
@@ -30,7 +33,7 @@ class Message(Document):
         indexes = [
             "session_id",
             "telegram_id",
-            [("session_id", 1), ("timestamp", 1)],
+            [("session_id", 1), ("_id", -1)],  # history in insertion order
             [("telegram_id", 1), ("timestamp", 1)],
         ]
 
@@ -1,7 +1,33 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from beanie import Document
-from pydantic import Field
+from pymongo import IndexModel
+from pydantic import BaseModel, Field
+
+
+# Compound index keys, also used as query hints
+SHORT_NAME_INDEX = [("telegram_id", 1), ("short_name", 1)]
+JIRA_PREFIX_INDEX = [("telegram_id", 1), ("jira_prefix", 1)]
+
+
+class RepositoryUrlView(BaseModel):
+    """Projection of Repository that only loads the repo URL."""
+
+    repo_url: str
+
+
+class RepositoryListView(BaseModel):
+    """Projection of Repository with only the fields shown by /git list."""
+
+    short_name: str
+    repo_url: str
+    jira_prefix: str
+    escaped_short_name: Optional[str] = None
+    escaped_repo_url: Optional[str] = None
+    escaped_jira_prefix: Optional[str] = None
+    registered: bool = False
+    primed: bool = False
+    last_primed: Optional[datetime] = None
 
 
 class Repository(Document):
@@ -21,6 +47,11 @@ class Repository(Document):
         description="Full GitHub URL (e.g., 'https://github.com/owner/repo.git')"
     )
 
+    # Markdown-escaped copies of the identifiers, computed once at write time
+    escaped_short_name: Optional[str] = Field(default=None, description="Markdown-escaped short_name")
+    escaped_repo_url: Optional[str] = Field(default=None, description="Markdown-escaped repo_url")
+    escaped_jira_prefix: Optional[str] = Field(default=None, description="Markdown-escaped jira_prefix")
+
     # Status tracking
     registered: bool = Field(default=False, description="Whether repo was successfully registered")
     primed: bool = Field(default=False, description="Whether repo was successfully primed with Claude Code")
@@ -34,16 +65,16 @@ class Repository(Document):
     )
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         name = "repositories"
         indexes = [
-            [("telegram_id", 1), ("short_name", 1)],  # Unique per user
-            [("telegram_id", 1), ("jira_prefix", 1)],
+            IndexModel(SHORT_NAME_INDEX, unique=True),  # Unique per user
+            JIRA_PREFIX_INDEX,
         ]
 
     def update_timestamp(self):
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
@@ -8,18 +8,25 @@ logger = structlog.get_logger()
 class ADWParser:
     """Parser for AI-Driven Workflow (ADW) commands."""
 
-    # Regex patterns
-    JIRA_PATTERN = r"\b([A-Z]+-\d+)\b"
-    GITHUB_REPO_PATTERN = r"(?:github\.com/|repo:?\s*)([a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)"
-    WORKFLOW_PATTERN = r"workflow:?\s*(\w+)"
-    REPORT_PATTERN = r"report:?\s*(minimal|basic|detailed|verbose)"
-
-    # Repo alias patterns - matches "in the <alias> repo" or "in <alias>"
-    REPO_ALIAS_PATTERNS = [
-        r"(?:in\s+the\s+)([a-zA-Z0-9_-]+)(?:\s+repo)",  # "in the bot repo"
-        r"(?:in\s+)([a-zA-Z0-9_-]+)(?:\s+repo)",  # "in bot repo"
-        r"(?:repo\s+alias:?\s*)([a-zA-Z0-9_-]+)",  # "repo alias: bot"
-    ]
+    # The Jira ticket is kept in the task description and may sit inside an
+    # alias ("in the MS-12 repo"), so it is searched for on its own
+    JIRA_RE = re.compile(r"\b([A-Z]+-\d+)\b")
+
+    # All other command tokens fused into one pattern, ignoring case. An
+    # alias's "repo" keyword never starts an explicit repo:owner/name, so
+    # "in the repo:org/x" resolves to org/x rather than alias "the"
+    COMBINED_RE = re.compile(
+        r"(?P<workflow>workflow:?\s*(?P<workflow_name>\w+))"
+        r"|(?P<report>report:?\s*(?P<report_level>minimal|basic|detailed|verbose))"
+        r"|(?P<repo>(?:github\.com/|repo:?\s*)(?P<repo_name>[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+))"
+        r"|(?P<alias_the>in\s+the\s+(?P<alias_the_name>[a-zA-Z0-9_-]+)\s+repo(?!:?\s*[a-zA-Z0-9_-]+/))"  # "in the bot repo"
+        r"|(?P<alias_in>in\s+(?P<alias_in_name>[a-zA-Z0-9_-]+)\s+repo(?!:?\s*[a-zA-Z0-9_-]+/))"  # "in bot repo"
+        r"|(?P<alias_kw>repo\s+alias:?\s*(?P<alias_kw_name>[a-zA-Z0-9_-]+))",  # "repo alias: bot"
+        re.IGNORECASE
+    )
+
+    # Repo alias alternatives in priority order
+    REPO_ALIAS_KINDS = ("alias_the", "alias_in", "alias_kw")
 
     @staticmethod
     def parse(command_text: str) -> Dict[str, Any]:
@@ -50,72 +57,56 @@ class ADWParser:
             "task_description": original_text
         }
 
-        # Extract workflow name
-        workflow_match = re.search(
-            ADWParser.WORKFLOW_PATTERN,
-            command_text,
-            re.IGNORECASE
-        )
-        if workflow_match:
-            result["workflow_name"] = workflow_match.group(1)
-            # Remove workflow specification from task description
-            command_text = re.sub(
-                ADWParser.WORKFLOW_PATTERN,
-                "",
-                command_text,
-                flags=re.IGNORECASE
-            )
+        # Single pass over the text; each match is dispatched on its group name
+        first = {}
+        spans = {}
+        add_first = first.setdefault
+        add_span = spans.setdefault
+        for match in ADWParser.COMBINED_RE.finditer(command_text):
+            kind = match.lastgroup
+            add_first(kind, match)
+            add_span(kind, []).append(match.span())
 
-        # Extract reporting level
-        report_match = re.search(
-            ADWParser.REPORT_PATTERN,
-            command_text,
-            re.IGNORECASE
-        )
-        if report_match:
-            result["reporting_level"] = report_match.group(1).lower()
-            # Remove report specification from task description
-            command_text = re.sub(
-                ADWParser.REPORT_PATTERN,
-                "",
-                command_text,
-                flags=re.IGNORECASE
-            )
+        removed = []
 
-        # Extract Jira ticket
-        jira_match = re.search(ADWParser.JIRA_PATTERN, command_text)
-        if jira_match:
-            result["jira_ticket"] = jira_match.group(1).upper()
-            # Extract prefix (e.g., "MS" from "MS-1234")
-            result["jira_prefix"] = result["jira_ticket"].split("-")[0]
+        if "workflow" in first:
+            result["workflow_name"] = first["workflow"].group("workflow_name")
+            removed += spans["workflow"]
 
-        # Extract GitHub repository (explicit format: repo:owner/repo or github.com/owner/repo)
-        repo_match = re.search(
-            ADWParser.GITHUB_REPO_PATTERN,
-            command_text,
-            re.IGNORECASE
-        )
-        if repo_match:
-            result["github_repo"] = repo_match.group(1)
-            # Remove repo specification from task description
-            command_text = re.sub(
-                ADWParser.GITHUB_REPO_PATTERN,
-                "",
-                command_text,
-                flags=re.IGNORECASE
-            )
+        if "report" in first:
+            result["reporting_level"] = first["report"].group("report_level").lower()
+            removed += spans["report"]
 
-        # Extract repo alias (e.g., "in the bot repo", "in ms-backend repo")
-        for pattern in ADWParser.REPO_ALIAS_PATTERNS:
-            alias_match = re.search(pattern, command_text, re.IGNORECASE)
-            if alias_match:
-                result["repo_alias"] = alias_match.group(1).lower()
-                # Remove alias specification from task description
-                command_text = re.sub(pattern, "", command_text, flags=re.IGNORECASE)
+        # Jira ticket stays in the task description
+        jira_match = ADWParser.JIRA_RE.search(command_text)
+        if jira_match:
+            jira_ticket = jira_match.group(1).upper()
+            result["jira_ticket"] = jira_ticket
+            # Extract prefix (e.g., "MS" from "MS-1234")
+            result["jira_prefix"] = jira_ticket.partition("-")[0]
+
+        # Explicit format: repo:owner/repo or github.com/owner/repo
+        if "repo" in first:
+            result["github_repo"] = first["repo"].group("repo_name")
+            removed += spans["repo"]
+
+        # Repo alias (e.g., "in the bot repo", "in ms-backend repo"), by priority
+        for kind in ADWParser.REPO_ALIAS_KINDS:
+            if kind in first:
+                result["repo_alias"] = first[kind].group(f"{kind}_name").lower()
+                removed += spans[kind]
                 break
 
+        # Rebuild the task description without the removed spans
+        parts = []
+        pos = 0
+        for span_start, span_end in sorted(removed):
+            parts.append(command_text[pos:span_start])
+            pos = span_end
+        parts.append(command_text[pos:])
+
         # Clean up task description (remove extra spaces)
-        result["task_description"] = " ".join(command_text.split()).strip()
+        result["task_description"] = " ".join("".join(parts).split())
 
         logger.info("Parsed ADW command", **result)
         return result
@@ -1,20 +1,21 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for history budgeting."""
+    return len(text) // 4 + 1
+
+
+@dataclass(slots=True, frozen=True)
 class AIResponse:
     """Response from AI provider."""
 
     content: str
     tokens_used: Optional[int] = None
     model: Optional[str] = None
-    metadata: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class AIService(ABC):
@@ -1,33 +1,73 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+import httpx
 import structlog
-from anthropic import AsyncAnthropic
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from anthropic import AsyncAnthropic, APIConnectionError, APIStatusError, RateLimitError
+from tenacity import (
+    retry,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential,
+)
 
 from bot.services.ai_service import AIService, AIResponse
 
 logger = structlog.get_logger()
 
 
+# One client per API key, shared by every ClaudeService instance
+_CLIENTS: Dict[str, AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str, http_client: Optional[httpx.AsyncClient]) -> AsyncAnthropic:
+    """
+    Return the cached client for an API key, creating it on first use.
+
+    SDK retries are disabled because send_message retries with tenacity.
+    """
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = AsyncAnthropic(api_key=api_key, max_retries=0, http_client=http_client)
+        _CLIENTS[api_key] = client
+    return client
+
+
+def _is_server_error(exc: BaseException) -> bool:
+    """Return True for 5xx responses from the Anthropic API."""
+    return isinstance(exc, APIStatusError) and 500 <= exc.status_code < 600
+
+
 class ClaudeService(AIService):
     """Anthropic Claude service implementation."""
 
-    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20250122"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-3-5-sonnet-20250122",
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize Claude service.
 
         Args:
             api_key: Anthropic API key
             model: Model to use (default: claude-3-5-sonnet-20250122)
+            http_client: HTTP client for the shared Anthropic client (used on first creation)
         """
         super().__init__(api_key)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = _get_client(api_key, http_client)
         self.model = model
         self.system_prompt = "You are a helpful assistant."
 
+    # Only transient failures are retried; 4xx errors fail fast
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
+        stop=stop_after_attempt(3) | stop_after_delay(15),
+        wait=wait_exponential(multiplier=1, min=1, max=8),
+        retry=(
+            retry_if_exception_type((APIConnectionError, RateLimitError))
+            | retry_if_exception(_is_server_error)
+        ),
         reraise=True,
     )
     async def send_message(
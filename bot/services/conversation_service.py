@@ -1,17 +1,173 @@
-from typing import List, Dict, Optional
-from datetime import datetime
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timezone
 import structlog
+from beanie import PydanticObjectId
+from beanie.operators import Inc, Set
+from pymongo.errors import BulkWriteError, DuplicateKeyError, WriteError
 
 from bot.models.conversation import Conversation
-from bot.models.message import Message, MessageRole
+from bot.models.message import Message, MessageBrief, MessageRole
+from bot.services.ai_service import estimate_tokens
 from bot.config import settings
 
 logger = structlog.get_logger()
 
 
+# Active conversation per (telegram_id, provider); the mapping only changes
+# on /new, which invalidates it
+_ACTIVE_CACHE_TTL = 600
+_ACTIVE_CACHE_SIZE = 10_000
+_ACTIVE_CACHE_STATS_EVERY = 1000
+_active_cache: "OrderedDict[Tuple[int, str], Tuple[float, Conversation]]" = OrderedDict()
+_active_cache_stats = {"hits": 0, "misses": 0}
+# Per-user locks serializing chat turns with /new
+_user_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+# Serializes cache fills with /new per (telegram_id, provider), so a lookup
+# racing /new cannot re-cache the conversation it just ended
+_active_locks: "weakref.WeakValueDictionary[Tuple[int, str], asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 class ConversationService:
     """Service for managing conversation history and sessions."""
 
+    # Buffered Message inserts, flushed with insert_many by _message_writer
+    _pending: Optional["asyncio.Queue[Tuple[Message, asyncio.Future]]"] = None
+    _writer_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start_writer(cls, batch_size: int = 100, flush_ms: int = 20):
+        """
+        Start the background task that batches message inserts.
+
+        Args:
+            batch_size: Maximum number of messages per insert_many
+            flush_ms: How long to wait for more messages before flushing
+        """
+        cls._pending = asyncio.Queue()
+        cls._writer_task = asyncio.create_task(
+            cls._message_writer(batch_size, flush_ms / 1000)
+        )
+
+    @classmethod
+    async def stop_writer(cls):
+        """Flush buffered messages and stop the writer task."""
+        if cls._writer_task is None:
+            return
+
+        await cls._pending.join()
+        cls._writer_task.cancel()
+        try:
+            await cls._writer_task
+        except asyncio.CancelledError:
+            pass
+        cls._writer_task = None
+        cls._pending = None
+
+    @classmethod
+    async def _message_writer(cls, batch_size: int, flush_interval: float):
+        """Drain queued messages and insert them in batches."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await cls._pending.get()]
+            deadline = loop.time() + flush_interval
+            while len(batch) < batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(cls._pending.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # One clock read per batch; messages in a batch share a timestamp.
+            # Ids are assigned here, in queue order, so each message knows its
+            # id even if other writes in the batch fail
+            now = datetime.now(timezone.utc)
+            for message, _ in batch:
+                message.timestamp = now
+                if message.id is None:
+                    message.id = PydanticObjectId()
+
+            try:
+                # Unordered: one failed write does not stop the rest
+                await Message.insert_many([m for m, _ in batch], ordered=False)
+                for message, future in batch:
+                    if not future.done():
+                        future.set_result(message)
+            except BulkWriteError as e:
+                # Only the writes listed in writeErrors failed; every other
+                # message in the batch was saved
+                failed = {error["index"]: error for error in e.details.get("writeErrors", [])}
+                logger.error(
+                    "Failed to insert some messages in batch",
+                    failed=len(failed),
+                    count=len(batch),
+                )
+                for index, (message, future) in enumerate(batch):
+                    if future.done():
+                        continue
+                    error = failed.get(index)
+                    if error is None:
+                        future.set_result(message)
+                    else:
+                        future.set_exception(
+                            WriteError(error.get("errmsg"), error.get("code"), error)
+                        )
+            except Exception as e:
+                logger.error("Failed to insert message batch", error=str(e), count=len(batch))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    cls._pending.task_done()
+
+    @classmethod
+    async def _insert_message(cls, message: Message) -> Message:
+        """
+        Insert a message through the write buffer, or directly if it is not running.
+
+        Args:
+            message: Message to insert
+
+        Returns:
+            The inserted Message
+        """
+        if cls._pending is None:
+            return await message.insert()
+
+        future = asyncio.get_running_loop().create_future()
+        await cls._pending.put((message, future))
+        return await future
+
+    @staticmethod
+    def user_lock(telegram_id: int) -> asyncio.Lock:
+        """
+        Get the lock that serializes a user's chat turns and /new.
+
+        Updates are handled concurrently, so without it a reply could be
+        saved to a session that /new has just ended.
+
+        Args:
+            telegram_id: Telegram user ID
+
+        Returns:
+            Lock shared by all handlers for this user
+        """
+        lock = _user_locks.get(telegram_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            _user_locks[telegram_id] = lock
+        return lock
+
     @staticmethod
     async def get_or_create_conversation(
         telegram_id: int, provider: str
@@ -26,6 +182,41 @@ class ConversationService:
         Returns:
             Active Conversation object
         """
+        key = (telegram_id, provider)
+        cached = _active_cache.get(key)
+        if (
+            cached
+            and cached[1].is_active
+            and time.monotonic() - cached[0] < _ACTIVE_CACHE_TTL
+        ):
+            _record_cache_lookup(hit=True)
+            return cached[1]
+        _record_cache_lookup(hit=False)
+
+        async with _active_lock(key):
+            return await ConversationService._load_or_create(telegram_id, provider)
+
+    @staticmethod
+    async def _load_or_create(telegram_id: int, provider: str) -> Conversation:
+        """
+        Find or create the active conversation and cache it.
+
+        Callers must hold _active_lock for (telegram_id, provider).
+
+        Args:
+            telegram_id: Telegram user ID
+            provider: AI provider name
+
+        Returns:
+            Active Conversation object
+        """
+        key = (telegram_id, provider)
+        now = time.monotonic()
+        # Another request may have filled the cache while this one waited
+        cached = _active_cache.get(key)
+        if cached and cached[1].is_active and now - cached[0] < _ACTIVE_CACHE_TTL:
+            return cached[1]
+
         # Try to find active conversation for this user and provider
         conversation = await Conversation.find_one(
             Conversation.telegram_id == telegram_id,
@@ -40,6 +231,7 @@ class ConversationService:
                 session_id=conversation.session_id,
                 provider=provider,
             )
+            _cache_active(key, now, conversation)
             return conversation
 
         # Create new conversation
@@ -48,7 +240,18 @@ class ConversationService:
             provider=provider,
             is_active=True,
         )
-        await conversation.insert()
+        try:
+            await conversation.insert()
+        except DuplicateKeyError:
+            # A concurrent request created the active conversation first
+            conversation = await Conversation.find_one(
+                Conversation.telegram_id == telegram_id,
+                Conversation.provider == provider,
+                Conversation.is_active == True,
+            )
+            _cache_active(key, now, conversation)
+            return conversation
+        _cache_active(key, now, conversation)
 
         logger.info(
             "Created new conversation",
@@ -60,34 +263,54 @@ class ConversationService:
 
     @staticmethod
     async def get_conversation_history(
-        session_id: str, max_messages: Optional[int] = None
+        session_id: str,
+        max_messages: Optional[int] = None,
+        max_tokens: Optional[int] = None,
     ) -> List[Dict[str, str]]:
         """
         Get conversation history for a session.
 
+        Messages are taken newest first until either limit is reached.
+
         Args:
             session_id: Conversation session ID
             max_messages: Maximum number of messages to retrieve (defaults to settings)
+            max_tokens: Estimated token budget for the history (defaults to settings)
 
         Returns:
             List of messages in format [{"role": "user", "content": "..."}, ...]
         """
         if max_messages is None:
             max_messages = settings.max_context_messages
+        if max_tokens is None:
+            max_tokens = settings.max_context_tokens
 
-        # Fetch messages sorted by timestamp
+        # Fetch only the last N messages, newest first, with just role/content
         messages = (
             await Message.find(Message.session_id == session_id)
-            .sort(+Message.timestamp)
+            .sort(-Message.id)
+            .limit(max_messages)
+            .project(MessageBrief)
             .to_list()
         )
 
-        # Take only the last N messages
-        messages = messages[-max_messages:]
+        # Keep the newest messages that fit the token budget
+        kept = []
+        budget = max_tokens
+        for msg in messages:
+            budget -= estimate_tokens(msg.content)
+            if budget < 0:
+                break
+            kept.append(msg)
+
+        # Providers expect the history to start with a user turn
+        if kept and kept[-1].role == "assistant":
+            kept.pop()
 
-        # Convert to format expected by AI services
+        # Convert to format expected by AI services (oldest first)
         history = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
+            {"role": msg.role, "content": msg.content}
+            for msg in reversed(kept)
         ]
 
         logger.info(
@@ -110,6 +333,9 @@ class ConversationService:
         """
         Save a message to the database.
 
+        Conversation metadata is not touched; callers update it separately
+        with update_conversation_meta once the turn's messages are saved.
+
         Args:
             session_id: Conversation session ID
             telegram_id: Telegram user ID
@@ -129,26 +355,40 @@ class ConversationService:
             provider=provider,
             tokens_used=tokens_used,
         )
-        await message.insert()
-
-        # Update conversation metadata
-        conversation = await Conversation.find_one(
-            Conversation.session_id == session_id
-        )
-        if conversation:
-            conversation.last_message_at = datetime.utcnow()
-            conversation.message_count += 1
-            await conversation.save()
+        await ConversationService._insert_message(message)
 
         logger.info(
             "Saved message",
             session_id=session_id,
-            role=role.value,
+            role=role,
             tokens_used=tokens_used,
         )
 
         return message
 
+    @staticmethod
+    async def update_conversation_meta(session_id: str, added: int = 1):
+        """
+        Bump message_count and last_message_at with one atomic update.
+
+        Safe to run as a background task: failures are logged, not raised.
+
+        Args:
+            session_id: Conversation session ID
+            added: Number of messages saved since the last update
+        """
+        try:
+            await Conversation.find_one(Conversation.session_id == session_id).update(
+                Inc({Conversation.message_count: added}),
+                Set({Conversation.last_message_at: datetime.now(timezone.utc)}),
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to update conversation metadata",
+                session_id=session_id,
+                error=str(e),
+            )
+
     @staticmethod
     async def start_new_conversation(telegram_id: int, provider: str) -> Conversation:
         """
@@ -161,25 +401,56 @@ class ConversationService:
         Returns:
             New Conversation object
         """
-        # Deactivate all active conversations for this user and provider
-        active_conversations = await Conversation.find(
-            Conversation.telegram_id == telegram_id,
-            Conversation.provider == provider,
-            Conversation.is_active == True,
-        ).to_list()
+        key = (telegram_id, provider)
+        async with _active_lock(key):
+            ended = _active_cache.pop(key, None)
+            if ended:
+                # Cache hits check this, so none can return the ended session
+                ended[1].is_active = False
 
-        for conv in active_conversations:
-            conv.is_active = False
-            await conv.save()
+            # Deactivate all active conversations for this user and provider
+            result = await Conversation.find(
+                Conversation.telegram_id == telegram_id,
+                Conversation.provider == provider,
+                Conversation.is_active == True,
+            ).update(Set({Conversation.is_active: False}))
 
-        logger.info(
-            "Deactivated conversations",
-            telegram_id=telegram_id,
-            provider=provider,
-            count=len(active_conversations),
-        )
+            logger.info(
+                "Deactivated conversations",
+                telegram_id=telegram_id,
+                provider=provider,
+                count=result.modified_count if result else 0,
+            )
 
-        # Create new conversation
-        return await ConversationService.get_or_create_conversation(
-            telegram_id, provider
+            # Create new conversation
+            return await ConversationService._load_or_create(telegram_id, provider)
+
+
+def _active_lock(key: Tuple[int, str]) -> asyncio.Lock:
+    """Get the lock guarding the active conversation for a user and provider."""
+    lock = _active_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _active_locks[key] = lock
+    return lock
+
+
+def _cache_active(key: Tuple[int, str], now: float, conversation: Conversation):
+    """Remember the active conversation for a user and provider."""
+    _active_cache[key] = (now, conversation)
+    _active_cache.move_to_end(key)
+    if len(_active_cache) > _ACTIVE_CACHE_SIZE:
+        _active_cache.popitem(last=False)
+
+
+def _record_cache_lookup(hit: bool):
+    """Count active-conversation cache lookups and log the hit rate periodically."""
+    _active_cache_stats["hits" if hit else "misses"] += 1
+    total = _active_cache_stats["hits"] + _active_cache_stats["misses"]
+    if total % _ACTIVE_CACHE_STATS_EVERY == 0:
+        logger.info(
+            "Active conversation cache stats",
+            hits=_active_cache_stats["hits"],
+            misses=_active_cache_stats["misses"],
+            size=len(_active_cache),
         )
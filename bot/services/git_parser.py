@@ -1,39 +1,68 @@
-import json
+import re
+from dataclasses import dataclass, fields
+
+import httpx
+import orjson
 import structlog
 from typing import Dict, Any, Optional
 from openai import AsyncOpenAI
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception_type
+
+from bot.services.openai_service import RETRYABLE_ERRORS
 
 logger = structlog.get_logger()
 
 
-class GitCommandParser:
-    """Parser for /git commands using OpenAI."""
+@dataclass(slots=True, frozen=True)
+class OpSpec:
+    """Supported /git operation and the fields it requires."""
 
-    def __init__(self, api_key: str):
-        """
-        Initialize Git command parser.
+    name: str
+    required_fields: tuple[str, ...] = ()
+    aliases: tuple[str, ...] = ()
 
-        Args:
-            api_key: OpenAI API key
-        """
-        self.client = AsyncOpenAI(api_key=api_key)
 
-    async def parse(self, command_text: str) -> Dict[str, Any]:
-        """
-        Parse /git command using OpenAI to extract structured information.
+@dataclass(slots=True, frozen=True)
+class ParsedGitCommand:
+    """Structured result of parsing a /git command."""
 
-        Args:
-            command_text: The text after /git command
+    operation: Optional[str] = None
+    short_name: Optional[str] = None
+    jira_prefix: Optional[str] = None
+    repo_url: Optional[str] = None
+    page: Optional[int] = None
+    error: Optional[str] = None
 
-        Returns:
-            Dictionary with parsed parameters:
-            - operation: 'add' or 'list' or 'remove' or None
-            - short_name: Short name for repository (e.g., 'backend')
-            - jira_prefix: Jira project prefix (e.g., 'MS', 'PROJ')
-            - repo_url: Repository URL (short or full form)
-            - error: Error message if parsing failed
-        """
-        system_prompt = """You are a Git command parser. Analyze the user's command and extract structured information.
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParsedGitCommand":
+        """Build from decoded JSON, ignoring any keys the model invented."""
+        return cls(**{name: data.get(name) for name in _PARSED_FIELDS})
+
+
+_PARSED_FIELDS = tuple(f.name for f in fields(ParsedGitCommand))
+
+_OPERATIONS: Dict[str, OpSpec] = {
+    spec.name: spec
+    for spec in (
+        OpSpec("add", ("short_name", "jira_prefix", "repo_url")),
+        OpSpec("list"),
+        OpSpec("remove", ("short_name",), aliases=("rm", "delete")),
+    )
+}
+_OP_ALIASES = {alias: spec.name for spec in _OPERATIONS.values() for alias in spec.aliases}
+
+# Well-formed commands that can be parsed without calling OpenAI
+_FAST_RE = re.compile(
+    rf"^\s*(?P<op>{'|'.join([*_OPERATIONS, *_OP_ALIASES])})\b(?P<args>.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_NAME_RE = re.compile(r"^[\w.-]+$")
+_PREFIX_RE = re.compile(r"^[A-Za-z][A-Za-z0-9]*$")
+# owner/repo from 'owner/repo', 'github.com/owner/repo' or 'https://github.com/owner/repo.git'
+_REPO_RE = re.compile(r"^(?:https?://)?(?:www\.)?(?:github\.com/)?([^/\s]+/[^/\s]+?)(?:\.git)?/?$")
+
+# Kept byte-identical across calls so OpenAI can reuse its prompt prefix cache
+_SYSTEM_PROMPT = """You are a Git command parser. Analyze the user's command and extract structured information.
 
 Supported operations: 'add', 'list', 'remove'
 
@@ -46,7 +75,7 @@ For 'add' operation, extract:
    - Full form with .git: https://github.com/owner/repo.git
 
 For 'list' operation:
-No additional parameters needed - just list all registered repositories
+1. page: Optional page number if the user asks for a specific page (e.g., 'list 2')
 
 For 'remove' operation, extract:
 1. short_name: The short name of the repository to remove (e.g., 'backend', 'api')
@@ -58,6 +87,7 @@ Return JSON in this exact format:
     "short_name": "extracted name" or null,
     "jira_prefix": "extracted prefix" or null,
     "repo_url": "extracted url" or null,
+    "page": page number or null,
     "error": "error message if cannot parse" or null
 }
 
@@ -70,7 +100,10 @@ Input: "add the backend repo for MS project, it's at github.com/EcorRouge/mcguir
 Output: {"operation": "add", "short_name": "backend", "jira_prefix": "MS", "repo_url": "EcorRouge/mcguire-sponsel-backend", "error": null}
 
 Input: "list"
-Output: {"operation": "list", "short_name": null, "jira_prefix": null, "repo_url": null, "error": null}
+Output: {"operation": "list", "short_name": null, "jira_prefix": null, "repo_url": null, "page": null, "error": null}
+
+Input: "list 2"
+Output: {"operation": "list", "short_name": null, "jira_prefix": null, "repo_url": null, "page": 2, "error": null}
 
 Input: "add api PROJ https://github.com/myorg/api-service.git"
 Output: {"operation": "add", "short_name": "api", "jira_prefix": "PROJ", "repo_url": "myorg/api-service", "error": null}
@@ -86,131 +119,184 @@ Output: {"operation": "remove", "short_name": "backend", "jira_prefix": null, "r
 
 If you cannot determine the operation or required fields are missing, set error field with explanation."""
 
-        try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": command_text}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.0
-            )
+# Request pieces that never change between calls
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+_RESPONSE_FORMAT = {"type": "json_object"}
 
-            result = json.loads(response.choices[0].message.content)
-            logger.info("Parsed git command", command=command_text, result=result)
-            return result
 
-        except json.JSONDecodeError as e:
-            logger.error("Failed to decode OpenAI response", error=str(e))
-            return {
-                "operation": None,
-                "short_name": None,
-                "jira_prefix": None,
-                "repo_url": None,
-                "error": "Failed to parse command"
-            }
-        except Exception as e:
-            logger.error("Error parsing git command", error=str(e))
-            return {
-                "operation": None,
-                "short_name": None,
-                "jira_prefix": None,
-                "repo_url": None,
-                "error": f"Error: {str(e)}"
-            }
+class GitCommandParser:
+    """Parser for /git commands using OpenAI."""
 
-    @staticmethod
-    def normalize_repo_url(repo_url: str) -> tuple[str, str]:
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None):
         """
-        Normalize repository URL to short form and full form.
+        Initialize Git command parser.
 
         Args:
-            repo_url: Repository URL in any format
+            api_key: OpenAI API key
+            http_client: Shared HTTP client to reuse connections across instances
+        """
+        self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        self._log = logger.bind(service="git_parser")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_random_exponential(min=1, max=8),
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        reraise=True,
+    )
+    async def _call_openai(self, command_text: str) -> str:
+        """
+        Ask OpenAI to parse a command, retrying transient failures.
+
+        Args:
+            command_text: The text after /git command
 
         Returns:
-            Tuple of (short_form, full_url)
-            - short_form: owner/repo
-            - full_url: https://github.com/owner/repo.git
+            Raw JSON content of the model reply
         """
-        # Remove .git suffix if present
-        repo_url = repo_url.rstrip("/").replace(".git", "")
+        response = await self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=(_SYSTEM_MESSAGE, {"role": "user", "content": command_text}),
+            response_format=_RESPONSE_FORMAT,
+            temperature=0.0
+        )
+        return response.choices[0].message.content
 
-        # Extract owner/repo from various formats
-        if "github.com/" in repo_url:
-            # Full URL format
-            parts = repo_url.split("github.com/")[-1]
-            short_form = parts.strip("/")
-        else:
-            # Already in short form
-            short_form = repo_url.strip("/")
+    @staticmethod
+    def _try_fast_parse(command_text: str) -> Optional[ParsedGitCommand]:
+        """
+        Parse strictly formatted commands locally.
 
-        # Build full URL
-        full_url = f"https://github.com/{short_form}.git"
+        Handles 'list [page]', 'remove|rm|delete <short_name>' and
+        'add <short_name> <jira_prefix> <owner/repo or URL>'.
 
-        return short_form, full_url
+        Args:
+            command_text: The text after /git command
 
-    @staticmethod
-    def validate_add_data(parsed_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+        Returns:
+            Parsed command in the same shape as the OpenAI result, or None
+            if the text needs the language model
         """
-        Validate parsed data for add operation.
+        match = _FAST_RE.match(command_text)
+        if not match:
+            return None
+
+        op = match.group("op").lower()
+        op = _OP_ALIASES.get(op, op)
+        args = match.group("args").split()
+
+        if op == "list":
+            if not args:
+                return ParsedGitCommand(operation=op)
+            if len(args) == 1 and args[0].isdigit():
+                return ParsedGitCommand(operation=op, page=int(args[0]))
+            return None
+
+        if op == "remove":
+            if len(args) == 1 and _NAME_RE.match(args[0]):
+                return ParsedGitCommand(operation=op, short_name=args[0])
+            return None
+
+        # add
+        if (
+            len(args) == 3
+            and _NAME_RE.match(args[0])
+            and _PREFIX_RE.match(args[1])
+            and "/" in args[2]
+        ):
+            short_name, jira_prefix, repo_url = args
+            return ParsedGitCommand(
+                operation=op,
+                short_name=short_name,
+                jira_prefix=jira_prefix,
+                repo_url=repo_url,
+            )
+        return None
+
+    async def parse(self, command_text: str) -> ParsedGitCommand:
+        """
+        Parse /git command into structured information.
+
+        Strictly formatted commands are parsed locally; anything else is
+        sent to OpenAI.
 
         Args:
-            parsed_data: Parsed command data
+            command_text: The text after /git command
 
         Returns:
-            Tuple of (is_valid, error_message)
+            ParsedGitCommand with:
+            - operation: 'add' or 'list' or 'remove' or None
+            - short_name: Short name for repository (e.g., 'backend')
+            - jira_prefix: Jira project prefix (e.g., 'MS', 'PROJ')
+            - repo_url: Repository URL (short or full form)
+            - page: Requested /git list page, if any
+            - error: Error message if parsing failed
         """
-        if parsed_data.get("error"):
-            return False, parsed_data["error"]
-
-        if parsed_data.get("operation") != "add":
-            return False, "Operation must be 'add'"
+        fast = self._try_fast_parse(command_text)
+        if fast is not None:
+            self._log.debug("Parsed git command locally", command=command_text, result=fast)
+            return fast
 
-        required_fields = ["short_name", "jira_prefix", "repo_url"]
-        for field in required_fields:
-            if not parsed_data.get(field):
-                return False, f"Missing required field: {field}"
+        try:
+            content = await self._call_openai(command_text)
+            data = orjson.loads(content)
+            if not isinstance(data, dict):
+                self._log.error("OpenAI returned non-object JSON", command=command_text)
+                return ParsedGitCommand(error="Failed to parse command")
+            result = ParsedGitCommand.from_dict(data)
+            self._log.info("Parsed git command", command=command_text, result=result)
+            return result
 
-        return True, None
+        except orjson.JSONDecodeError as e:
+            self._log.error("Failed to decode OpenAI response", error=str(e))
+            return ParsedGitCommand(error="Failed to parse command")
+        except Exception as e:
+            self._log.error("Error parsing git command", error=str(e))
+            return ParsedGitCommand(error=f"Error: {str(e)}")
 
     @staticmethod
-    def validate_list_data(parsed_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+    def normalize_repo_url(repo_url: str) -> tuple[str, str]:
         """
-        Validate parsed data for list operation.
+        Normalize repository URL to short form and full form.
 
         Args:
-            parsed_data: Parsed command data
+            repo_url: Repository URL in any format
 
         Returns:
-            Tuple of (is_valid, error_message)
-        """
-        if parsed_data.get("error"):
-            return False, parsed_data["error"]
+            Tuple of (short_form, full_url)
+            - short_form: owner/repo
+            - full_url: https://github.com/owner/repo.git
 
-        if parsed_data.get("operation") != "list":
-            return False, "Operation must be 'list'"
+        Raises:
+            ValueError: If the URL is not a GitHub owner/repo reference
+        """
+        match = _REPO_RE.match(repo_url.strip())
+        if not match:
+            raise ValueError(f"Unrecognized repository URL: {repo_url}")
 
-        return True, None
+        short_form = match.group(1)
+        return short_form, f"https://github.com/{short_form}.git"
 
     @staticmethod
-    def validate_remove_data(parsed_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+    def validate(parsed_data: ParsedGitCommand, expected_op: str) -> tuple[bool, Optional[str]]:
         """
-        Validate parsed data for remove operation.
+        Validate parsed data for an operation.
 
         Args:
             parsed_data: Parsed command data
+            expected_op: Operation the caller is handling ('add', 'list', 'remove')
 
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if parsed_data.get("error"):
-            return False, parsed_data["error"]
+        if parsed_data.error:
+            return False, parsed_data.error
 
-        if parsed_data.get("operation") != "remove":
-            return False, "Operation must be 'remove'"
+        if parsed_data.operation != expected_op:
+            return False, f"Operation must be '{expected_op}'"
 
-        if not parsed_data.get("short_name"):
-            return False, "Missing required field: short_name"
+        for field in _OPERATIONS[expected_op].required_fields:
+            if not getattr(parsed_data, field):
+                return False, f"Missing required field: {field}"
 
         return True, None
@@ -1,15 +1,97 @@
+import asyncio
+import time
+from collections import OrderedDict
 import aiohttp
+import orjson
 import structlog
 from typing import Dict, Any, Optional
 from base64 import b64encode
 
+from bot.clients import json_dumps
+
 logger = structlog.get_logger()
 
+# Recently fetched issues, shared by all JiraService instances:
+# (jira_url, issue_key, with_comments) -> (fetched_at, issue)
+_ISSUE_CACHE_TTL = 60
+_ISSUE_CACHE_SIZE = 1024
+_issue_cache: "OrderedDict[tuple[str, str, bool], tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _cache_get(key: tuple[str, str, bool]) -> Optional[Dict[str, Any]]:
+    """Return a copy of a fresh cached issue, or None."""
+    entry = _issue_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _ISSUE_CACHE_TTL:
+        return dict(entry[1])
+    return None
+
+
+def _cache_put(key: tuple[str, str, bool], issue: Dict[str, Any]):
+    """Store a copy of an issue, evicting the oldest entry when full."""
+    _issue_cache[key] = (time.monotonic(), dict(issue))
+    _issue_cache.move_to_end(key)
+    if len(_issue_cache) > _ISSUE_CACHE_SIZE:
+        _issue_cache.popitem(last=False)
+
+
+# Cap on concurrent requests made by the bulk getters, to stay clear of Jira 429s
+_MAX_CONCURRENT_FETCHES = 8
+
+# Shared read-only fallback for missing nested fields
+_EMPTY: Dict[str, Any] = {}
+
+
+def _extract_text_from_adf(adf_node: Dict[str, Any]) -> str:
+    """
+    Extract text from Atlassian Document Format.
+
+    Walks the tree depth-first with an explicit stack, so deeply nested
+    documents cannot hit the recursion limit.
+
+    Args:
+        adf_node: ADF node
+
+    Returns:
+        Plain text content
+    """
+    text_parts = []
+    stack = [adf_node]
+
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        text = node.get("text")
+        if text:
+            text_parts.append(text)
+
+        content = node.get("content")
+        if isinstance(content, list):
+            # Reversed so pops come out in document order
+            stack.extend(reversed(content))
+
+    return " ".join(text_parts)
+
+
+# Description/comment body converters by JSON type: plain text or ADF document
+_DESCRIPTION_HANDLERS = {str: str, dict: _extract_text_from_adf}
+
+
+class JiraServiceError(Exception):
+    """Raised when the Jira API cannot be reached or rejects a request."""
+
 
 class JiraService:
     """Service for interacting with Jira Cloud API."""
 
-    def __init__(self, jira_url: str, email: str, api_token: str):
+    def __init__(
+        self,
+        jira_url: str,
+        email: str,
+        api_token: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         """
         Initialize Jira service.
 
@@ -17,8 +99,12 @@ class JiraService:
             jira_url: Jira Cloud URL (e.g., https://your-domain.atlassian.net)
             email: Jira user email
             api_token: Jira API token
+            session: Shared session to reuse; if omitted the service opens its own on first use
         """
         self.jira_url = jira_url.rstrip("/")
+        self._log = logger.bind(service="jira", jira_url=self.jira_url)
+        self.session = session
+        self._owns_session = False
         self.email = email
         self.api_token = api_token
 
@@ -26,6 +112,32 @@ class JiraService:
         credentials = f"{email}:{api_token}"
         self.auth_header = b64encode(credentials.encode()).decode()
 
+        # Built once and sent with every request; the session may be shared
+        # with other credentials, so these are not set as session defaults
+        self._headers = {
+            "Authorization": f"Basic {self.auth_header}",
+            "Accept": "application/json",
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived session, creating a pooled one if none was given."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+                json_serialize=json_dumps,
+            )
+            self._owns_session = True
+        return self.session
+
+    async def close(self):
+        """Close the session if this service created it."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
+
     async def get_issue(self, issue_key: str) -> Optional[Dict[str, Any]]:
         """
         Fetch issue details from Jira.
@@ -35,13 +147,17 @@ class JiraService:
 
         Returns:
             Dictionary with issue details or None if not found
+
+        Raises:
+            JiraServiceError: If Jira is unreachable, times out, rejects the
+                request or returns a malformed body
         """
-        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
+        cache_key = (self.jira_url, issue_key, False)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        headers = {
-            "Authorization": f"Basic {self.auth_header}",
-            "Accept": "application/json",
-        }
+        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
 
         # Request specific fields to reduce response size
         params = {
@@ -49,42 +165,48 @@ class JiraService:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(
-                            "Successfully fetched Jira issue",
-                            issue_key=issue_key,
-                        )
-                        return self._format_issue(data)
-                    elif response.status == 404:
-                        logger.warning("Jira issue not found", issue_key=issue_key)
-                        return None
-                    elif response.status == 401:
-                        logger.error(
-                            "Jira authentication failed",
-                            issue_key=issue_key,
-                            status=response.status,
-                        )
-                        raise Exception("Jira authentication failed. Check your credentials.")
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            "Failed to fetch Jira issue",
-                            issue_key=issue_key,
-                            status=response.status,
-                            error=error_text,
-                        )
-                        raise Exception(f"Failed to fetch Jira issue: {response.status}")
-
-        except aiohttp.ClientError as e:
-            logger.error(
+            session = self._get_session()
+            async with session.get(url, headers=self._headers, params=params) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    self._log.debug("Fetched Jira issue", issue_key=issue_key)
+                    issue = self._format_issue(data)
+                    _cache_put(cache_key, issue)
+                    return issue
+                elif response.status == 404:
+                    self._log.warning("Jira issue not found", issue_key=issue_key)
+                    return None
+                elif response.status == 401:
+                    self._log.error(
+                        "Jira authentication failed",
+                        issue_key=issue_key,
+                        status=response.status,
+                    )
+                    raise JiraServiceError("Jira authentication failed. Check your credentials.")
+                else:
+                    error_text = await response.text()
+                    self._log.error(
+                        "Failed to fetch Jira issue",
+                        issue_key=issue_key,
+                        status=response.status,
+                        error=error_text,
+                    )
+                    raise JiraServiceError(f"Failed to fetch Jira issue: {response.status}")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._log.error(
                 "Network error fetching Jira issue",
                 issue_key=issue_key,
+                error=str(e) or type(e).__name__,
+            )
+            raise JiraServiceError(f"Network error: {str(e) or type(e).__name__}")
+        except orjson.JSONDecodeError as e:
+            self._log.error(
+                "Invalid JSON from Jira",
+                issue_key=issue_key,
                 error=str(e),
             )
-            raise Exception(f"Network error: {str(e)}")
+            raise JiraServiceError("Invalid response from Jira")
 
     async def get_issue_with_comments(self, issue_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -96,50 +218,108 @@ class JiraService:
         Returns:
             Dictionary with issue details and comments or None if not found
         """
-        # First get the issue
-        issue = await self.get_issue(issue_key)
+        cache_key = (self.jira_url, issue_key, True)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Fetch the issue and its comments concurrently; comments are
+        # discarded if the issue does not exist
+        comments_task = asyncio.create_task(self._fetch_comments(issue_key))
+        try:
+            issue = await self.get_issue(issue_key)
+        except BaseException:
+            comments_task.cancel()
+            raise
+
         if not issue:
+            comments_task.cancel()
             return None
 
-        # Now get comments
-        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/comment"
+        issue["comments"] = await comments_task
+        self._log.info(
+            "Successfully fetched Jira issue with comments",
+            issue_key=issue_key,
+            comment_count=len(issue["comments"]),
+        )
+        _cache_put(cache_key, issue)
+        return issue
 
-        headers = {
-            "Authorization": f"Basic {self.auth_header}",
-            "Accept": "application/json",
-        }
+    async def get_issues(self, issue_keys: list[str]) -> list[Optional[Dict[str, Any]]]:
+        """
+        Fetch several issues concurrently.
+
+        Args:
+            issue_keys: Jira issue keys (e.g., ["MS-1234", "MS-1235"])
+
+        Returns:
+            Issue details in the same order as issue_keys; None for missing issues
+        """
+        return await self._gather_limited(self.get_issue, issue_keys)
+
+    async def get_issues_with_comments(
+        self, issue_keys: list[str]
+    ) -> list[Optional[Dict[str, Any]]]:
+        """
+        Fetch several issues with their comments concurrently.
+
+        Args:
+            issue_keys: Jira issue keys (e.g., ["MS-1234", "MS-1235"])
+
+        Returns:
+            Issue details with comments in the same order as issue_keys;
+            None for missing issues
+        """
+        return await self._gather_limited(self.get_issue_with_comments, issue_keys)
+
+    @staticmethod
+    async def _gather_limited(fetch, issue_keys: list[str]) -> list[Optional[Dict[str, Any]]]:
+        """Run fetch for each distinct key, at most _MAX_CONCURRENT_FETCHES at a time."""
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+        async def limited(issue_key: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await fetch(issue_key)
+
+        unique_keys = list(dict.fromkeys(issue_keys))
+        results = await asyncio.gather(*(limited(key) for key in unique_keys))
+        by_key = dict(zip(unique_keys, results))
+        return [by_key[key] for key in issue_keys]
+
+    async def _fetch_comments(self, issue_key: str) -> list[Dict[str, Any]]:
+        """
+        Fetch and format the comments of an issue.
+
+        Args:
+            issue_key: Jira issue key (e.g., "MS-1234")
+
+        Returns:
+            Formatted comments, or an empty list if they could not be fetched
+        """
+        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/comment"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        comments = self._format_comments(data.get("comments", []))
-                        issue["comments"] = comments
-                        logger.info(
-                            "Successfully fetched Jira issue with comments",
-                            issue_key=issue_key,
-                            comment_count=len(comments),
-                        )
-                        return issue
-                    else:
-                        # If comments fail, still return the issue
-                        logger.warning(
-                            "Failed to fetch comments, returning issue without comments",
-                            issue_key=issue_key,
-                            status=response.status,
-                        )
-                        issue["comments"] = []
-                        return issue
-
-        except aiohttp.ClientError as e:
-            logger.warning(
-                "Network error fetching comments, returning issue without comments",
+            session = self._get_session()
+            async with session.get(url, headers=self._headers) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    return self._format_comments(data.get("comments", []))
+
+                # If comments fail, the issue is still returned
+                self._log.warning(
+                    "Failed to fetch comments, returning issue without comments",
+                    issue_key=issue_key,
+                    status=response.status,
+                )
+                return []
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            self._log.warning(
+                "Failed to fetch comments, returning issue without comments",
                 issue_key=issue_key,
-                error=str(e),
+                error=str(e) or type(e).__name__,
             )
-            issue["comments"] = []
-            return issue
+            return []
 
     def _format_comments(self, raw_comments: list) -> list[Dict[str, Any]]:
         """
@@ -151,22 +331,16 @@ class JiraService:
         Returns:
             List of formatted comments
         """
-        formatted_comments = []
-
-        for comment in raw_comments:
-            author = comment.get("author", {})
-            author_name = author.get("displayName", "Unknown")
-
-            # Extract comment body (may be ADF format)
-            body = self._extract_description(comment.get("body"))
-
-            formatted_comments.append({
-                "author": author_name,
+        extract = self._extract_description
+        # Comment bodies may be ADF or plain text
+        return [
+            {
+                "author": (comment.get("author") or _EMPTY).get("displayName", "Unknown"),
                 "created": comment.get("created", ""),
-                "body": body
-            })
-
-        return formatted_comments
+                "body": extract(comment.get("body")),
+            }
+            for comment in raw_comments
+        ]
 
     def _format_issue(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -178,52 +352,28 @@ class JiraService:
         Returns:
             Formatted issue data
         """
-        fields = raw_data.get("fields", {})
-
-        # Extract assignee name
-        assignee = fields.get("assignee")
-        assignee_name = assignee.get("displayName") if assignee else "Unassigned"
-
-        # Extract reporter name
-        reporter = fields.get("reporter")
-        reporter_name = reporter.get("displayName") if reporter else "Unknown"
-
-        # Extract status
-        status = fields.get("status", {})
-        status_name = status.get("name", "Unknown")
+        fields = raw_data.get("fields") or _EMPTY
+        fields_get = fields.get
+        key = raw_data.get("key")
 
-        # Extract priority
-        priority = fields.get("priority", {})
-        priority_name = priority.get("name", "None")
-
-        # Extract issue type
-        issue_type = fields.get("issuetype", {})
-        issue_type_name = issue_type.get("name", "Unknown")
-
-        # Extract labels
-        labels = fields.get("labels", [])
-
-        # Extract components
-        components = fields.get("components", [])
-        component_names = [c.get("name") for c in components]
-
-        # Get description (may be in ADF format or plain text)
-        description = self._extract_description(fields.get("description"))
+        assignee = fields_get("assignee")
+        reporter = fields_get("reporter")
 
         return {
-            "key": raw_data.get("key"),
-            "summary": fields.get("summary", ""),
-            "description": description,
-            "status": status_name,
-            "priority": priority_name,
-            "assignee": assignee_name,
-            "reporter": reporter_name,
-            "issue_type": issue_type_name,
-            "created": fields.get("created", ""),
-            "updated": fields.get("updated", ""),
-            "labels": labels,
-            "components": component_names,
-            "url": f"{self.jira_url}/browse/{raw_data.get('key')}",
+            "key": key,
+            "summary": fields_get("summary", ""),
+            # Description may be in ADF format or plain text
+            "description": self._extract_description(fields_get("description")),
+            "status": (fields_get("status") or _EMPTY).get("name", "Unknown"),
+            "priority": (fields_get("priority") or _EMPTY).get("name", "None"),
+            "assignee": assignee.get("displayName") if assignee else "Unassigned",
+            "reporter": reporter.get("displayName") if reporter else "Unknown",
+            "issue_type": (fields_get("issuetype") or _EMPTY).get("name", "Unknown"),
+            "created": fields_get("created", ""),
+            "updated": fields_get("updated", ""),
+            "labels": fields_get("labels") or [],
+            "components": [c.get("name") for c in fields_get("components") or ()],
+            "url": f"{self.jira_url}/browse/{key}",
         }
 
     def _extract_description(self, description: Any) -> str:
@@ -239,40 +389,5 @@ class JiraService:
         if not description:
             return "No description"
 
-        # If it's already a string, return it
-        if isinstance(description, str):
-            return description
-
-        # If it's ADF (Atlassian Document Format), extract text
-        if isinstance(description, dict):
-            return self._extract_text_from_adf(description)
-
-        return "No description"
-
-    def _extract_text_from_adf(self, adf_node: Dict[str, Any]) -> str:
-        """
-        Recursively extract text from Atlassian Document Format.
-
-        Args:
-            adf_node: ADF node
-
-        Returns:
-            Plain text content
-        """
-        if not isinstance(adf_node, dict):
-            return ""
-
-        text_parts = []
-
-        # If node has text, add it
-        if "text" in adf_node:
-            text_parts.append(adf_node["text"])
-
-        # Recursively process content
-        if "content" in adf_node and isinstance(adf_node["content"], list):
-            for child in adf_node["content"]:
-                child_text = self._extract_text_from_adf(child)
-                if child_text:
-                    text_parts.append(child_text)
-
-        return " ".join(text_parts)
+        handler = _DESCRIPTION_HANDLERS.get(type(description))
+        return handler(description) if handler else "No description"
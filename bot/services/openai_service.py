@@ -1,33 +1,127 @@
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Optional
+import httpx
 import structlog
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, RateLimitError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from bot.services.ai_service import AIService, AIResponse
+from bot.config import settings
+from bot.services.ai_service import AIService, AIResponse, estimate_tokens
 
 logger = structlog.get_logger()
 
+# Transient OpenAI failures worth retrying; anything else fails fast
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, APITimeoutError)
+
 
 class OpenAIService(AIService):
     """OpenAI GPT service implementation."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4-turbo-preview"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4-turbo-preview",
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize OpenAI service.
 
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4-turbo-preview)
+            http_client: Shared HTTP client to reuse connections across instances
         """
         super().__init__(api_key)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
         self.model = model
+        self._log = logger.bind(service="openai", model=model)
         self.system_prompt = "You are a helpful assistant."
+        self._warmed_up = False
+
+    async def warmup(self):
+        """
+        Open a connection to the OpenAI API ahead of the first request.
+
+        Only the first call does any work; failures are logged and ignored
+        since the real request will surface them.
+        """
+        if self._warmed_up:
+            return
+        try:
+            await self.client.models.retrieve(self.model)
+            self._warmed_up = True
+        except Exception as e:
+            self._log.warning("OpenAI warmup failed", error=str(e))
+
+    def _build_messages(
+        self,
+        message: str,
+        conversation_history: List[Dict[str, str]],
+    ) -> List[Dict[str, str]]:
+        """
+        Build the messages list: system prompt, history, then the new message.
+
+        History is cut from the oldest end to fit settings.max_context_tokens,
+        the same budget get_conversation_history applies, so history from
+        any other source also costs a bounded number of prompt tokens.
+        """
+        start = len(conversation_history)
+        budget = settings.max_context_tokens
+        while start > 0:
+            budget -= estimate_tokens(conversation_history[start - 1]["content"])
+            if budget < 0:
+                break
+            start -= 1
+
+        # The history must start with a user turn
+        while start < len(conversation_history) and conversation_history[start]["role"] != "user":
+            start += 1
+
+        if start:
+            self._log.debug(
+                "Trimmed conversation history",
+                dropped=start,
+                kept=len(conversation_history) - start,
+            )
+
+        messages = [{"role": "system", "content": self.system_prompt}]
+        messages.extend(conversation_history[start:])
+        messages.append({"role": "user", "content": message})
+        return messages
+
+    async def stream_message(
+        self,
+        message: str,
+        conversation_history: List[Dict[str, str]],
+    ) -> AsyncIterator[str]:
+        """
+        Stream a reply from OpenAI as it is generated.
+
+        Not retried: text already yielded to the caller cannot be taken back.
+
+        Args:
+            message: User message to send
+            conversation_history: List of previous messages
+
+        Yields:
+            Content deltas in order
+        """
+        messages = self._build_messages(message, conversation_history)
+
+        self._log.debug("Streaming message to OpenAI", message_count=len(messages))
+
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
         reraise=True,
     )
     async def send_message(
@@ -46,16 +140,9 @@ class OpenAIService(AIService):
             AIResponse with content and metadata
         """
         try:
-            # Build messages list with system prompt
-            messages = [{"role": "system", "content": self.system_prompt}]
-            messages.extend(conversation_history)
-            messages.append({"role": "user", "content": message})
+            messages = self._build_messages(message, conversation_history)
 
-            logger.info(
-                "Sending message to OpenAI",
-                model=self.model,
-                message_count=len(messages),
-            )
+            self._log.debug("Sending message to OpenAI", message_count=len(messages))
 
             # Call OpenAI API
             response = await self.client.chat.completions.create(
@@ -64,13 +151,10 @@ class OpenAIService(AIService):
             )
 
             content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens if response.usage else None
+            usage = response.usage
+            tokens_used = usage.total_tokens if usage else None
 
-            logger.info(
-                "Received response from OpenAI",
-                tokens_used=tokens_used,
-                model=self.model,
-            )
+            self._log.info("Received response from OpenAI", tokens_used=tokens_used)
 
             return AIResponse(
                 content=content,
@@ -78,13 +162,13 @@ class OpenAIService(AIService):
                 model=self.model,
                 metadata={
                     "finish_reason": response.choices[0].finish_reason,
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else None,
+                    "prompt_tokens": usage.prompt_tokens if usage else None,
+                    "completion_tokens": usage.completion_tokens if usage else None,
                 },
             )
 
         except Exception as e:
-            logger.error("Error calling OpenAI API", error=str(e), model=self.model)
+            self._log.error("Error calling OpenAI API", error=str(e))
             raise
 
     def get_provider_name(self) -> str:
@@ -1,37 +1,76 @@
-import json
 import asyncio
+import orjson
 import structlog
-from typing import Dict, Any, Optional, Callable
+import zlib
+from typing import Dict, Any, List, Optional, Callable
 from redis.asyncio import Redis
-from redis.exceptions import RedisError
+from redis.exceptions import RedisError, ResponseError
 
 logger = structlog.get_logger()
 
+# Shared with the worker; bytes skip redis-py's per-command str encoding
+TASKS_QUEUE = b"adw:tasks"
+RESPONSES_STREAM = b"adw:responses"
+
+# Worker responses are read from the stream through a consumer group, so
+# entries delivered while the bot was down or not yet acknowledged survive
+RESPONSES_GROUP = b"bot"
+RESPONSES_CONSUMER = b"bot-1"
+_RESPONSES_READ_COUNT = 64
+
+# Retry delays (seconds) for the response listener after a Redis error
+_LISTEN_BACKOFF_MIN = 0.1
+_LISTEN_BACKOFF_MAX = 30
+
+# Task payloads above this size are zlib-compressed; compressed payloads
+# start with b"x", which JSON never does, so the worker tells them apart
+_COMPRESS_THRESHOLD = 1024
+
+
+def _encode_task(task_data: Dict[str, Any]) -> bytes:
+    """
+    Encode a task for the worker queue.
+
+    Args:
+        task_data: Task data to send to worker
+
+    Returns:
+        JSON bytes, zlib-compressed when larger than _COMPRESS_THRESHOLD
+    """
+    payload = orjson.dumps(task_data)
+    if len(payload) > _COMPRESS_THRESHOLD:
+        return zlib.compress(payload, 1)
+    return payload
+
 
 class RedisService:
     """Service for Redis message queue operations."""
 
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, batch_size: int = 32, flush_ms: int = 2):
         """
         Initialize Redis service.
 
         Args:
             redis_url: Redis connection URL
+            batch_size: Maximum number of tasks sent in one pipeline
+            flush_ms: How long to wait for more tasks before flushing a batch
         """
         self.redis_url = redis_url
         self.redis: Optional[Redis] = None
-        self.pubsub = None
+        self.stream_redis: Optional[Redis] = None
         self.listener_task = None
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000
+        self._publish_queue: asyncio.Queue = asyncio.Queue()
+        self._batch_task = None
 
     async def connect(self):
         """Connect to Redis."""
         try:
-            self.redis = Redis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True
-            )
+            # Raw bytes in and out; payloads are orjson-encoded
+            self.redis = Redis.from_url(self.redis_url)
             await self.redis.ping()
+            self._batch_task = asyncio.create_task(self._batch_publisher())
             logger.info("Connected to Redis", url=self.redis_url)
         except RedisError as e:
             logger.error("Failed to connect to Redis", error=str(e))
@@ -39,15 +78,16 @@ class RedisService:
 
     async def disconnect(self):
         """Disconnect from Redis."""
-        if self.listener_task:
-            self.listener_task.cancel()
-            try:
-                await self.listener_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self.listener_task, self._batch_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
-        if self.pubsub:
-            await self.pubsub.close()
+        if self.stream_redis:
+            await self.stream_redis.close()
 
         if self.redis:
             await self.redis.close()
@@ -64,14 +104,91 @@ class RedisService:
             True if published successfully
         """
         try:
-            task_json = json.dumps(task_data)
-            await self.redis.lpush("adw:tasks", task_json)
+            await self.redis.lpush(TASKS_QUEUE, _encode_task(task_data))
             logger.info("Published task to queue", task_id=task_data.get("task_id"))
             return True
         except Exception as e:
             logger.error("Failed to publish task", error=str(e))
             return False
 
+    async def publish_many(self, tasks: List[Dict[str, Any]]) -> bool:
+        """
+        Publish several tasks to the worker queue in one pipelined round-trip.
+
+        Args:
+            tasks: Task data dicts to send to worker
+
+        Returns:
+            True if all tasks were published
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for task_data in tasks:
+                    pipe.lpush(TASKS_QUEUE, _encode_task(task_data))
+                await pipe.execute()
+            logger.info(
+                "Published task batch to queue",
+                task_ids=[task_data.get("task_id") for task_data in tasks]
+            )
+            return True
+        except Exception as e:
+            logger.error("Failed to publish task batch", error=str(e), count=len(tasks))
+            return False
+
+    async def publish_task_batched(self, task_data: Dict[str, Any]) -> bool:
+        """
+        Publish a task through the batching pipeline.
+
+        Tasks published concurrently within the flush interval are sent
+        to Redis in a single pipeline round-trip.
+
+        Args:
+            task_data: Task data to send to worker
+
+        Returns:
+            True if published successfully
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._publish_queue.put((task_data, future))
+        return await future
+
+    def publish_task_async(self, task_data: Dict[str, Any]) -> asyncio.Task:
+        """
+        Publish a task without waiting for the Redis acknowledgement.
+
+        Use publish_task when the caller needs a synchronous confirmation.
+
+        Args:
+            task_data: Task data to send to worker
+
+        Returns:
+            Background task resolving to True if published successfully
+        """
+        return asyncio.create_task(self.publish_task_batched(task_data))
+
+    async def _batch_publisher(self):
+        """Drain queued tasks and push them to Redis in pipelined batches."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._publish_queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._publish_queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            success = await self.publish_many([task_data for task_data, _ in batch])
+
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(success)
+
     async def start_listener(self, callback: Callable[[Dict[str, Any]], Any]):
         """
         Start listening for worker responses.
@@ -80,8 +197,13 @@ class RedisService:
             callback: Async function to call when message received
         """
         try:
-            self.pubsub = self.redis.pubsub()
-            await self.pubsub.subscribe("adw:responses")
+            # Blocking stream reads get their own single-connection client so
+            # they never hold up task publishes. Larger reads let hiredis
+            # decode bursts of responses in one pass
+            self.stream_redis = Redis.from_url(
+                self.redis_url, socket_read_size=65536, max_connections=1
+            )
+            await self._ensure_group()
             logger.info("Started listening for worker responses")
 
             self.listener_task = asyncio.create_task(
@@ -95,22 +217,105 @@ class RedisService:
         """
         Internal loop for listening to messages.
 
+        The worker appends newline-delimited JSON frames to the responses
+        stream; each line is handed to the callback in order. Entries are
+        acknowledged once handled, and entries left unacknowledged by a
+        previous run are read again first.
+
+        Args:
+            callback: Function to call with received messages
+        """
+        # "0" re-reads this consumer's pending entries; ">" reads new ones
+        last_id = b"0"
+        backoff = _LISTEN_BACKOFF_MIN
+        recreate_group = False
+        while True:
+            try:
+                if recreate_group:
+                    await self._ensure_group()
+                    recreate_group = False
+                streams = await self.stream_redis.xreadgroup(
+                    RESPONSES_GROUP,
+                    RESPONSES_CONSUMER,
+                    {RESPONSES_STREAM: last_id},
+                    count=_RESPONSES_READ_COUNT,
+                    block=1000,
+                )
+                backoff = _LISTEN_BACKOFF_MIN
+                entries = streams[0][1] if streams else []
+                if not entries:
+                    last_id = b">"
+                    continue
+
+                for entry_id, fields in entries:
+                    await self._handle_entry(entry_id, fields, callback)
+
+                await self.stream_redis.xack(
+                    RESPONSES_STREAM, RESPONSES_GROUP, *(entry_id for entry_id, _ in entries)
+                )
+            except asyncio.CancelledError:
+                logger.info("Listener loop cancelled")
+                raise
+            except Exception as e:
+                # Redis lost the stream or group (restart without
+                # persistence); recreate it before reading again
+                recreate_group = isinstance(e, ResponseError) and "NOGROUP" in str(e)
+                delay = min(backoff, _LISTEN_BACKOFF_MAX)
+                logger.error("Listener loop error, retrying", error=str(e), delay=delay)
+                await asyncio.sleep(delay)
+                backoff *= 2
+                # Redeliver whatever was read but not acknowledged
+                last_id = b"0"
+
+    async def _ensure_group(self):
+        """Create the responses stream and consumer group if missing."""
+        try:
+            await self.stream_redis.xgroup_create(
+                RESPONSES_STREAM, RESPONSES_GROUP, id="$", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _handle_entry(
+        self,
+        entry_id: bytes,
+        fields: Optional[Dict[bytes, bytes]],
+        callback: Callable[[Dict[str, Any]], Any],
+    ):
+        """
+        Hand every response frame in one stream entry to the callback.
+
+        Never raises, so one bad entry cannot stop the listener; the caller
+        acknowledges it either way.
+
         Args:
+            entry_id: Stream entry ID
+            fields: Entry fields; None for pending entries already trimmed
+                from the stream
             callback: Function to call with received messages
         """
+        if not fields or b"d" not in fields:
+            logger.warning("Skipping empty or trimmed response entry", entry_id=entry_id)
+            return
+
         try:
-            async for message in self.pubsub.listen():
-                if message["type"] == "message":
-                    try:
-                        data = json.loads(message["data"])
-                        logger.info("Received worker response", data=data)
-                        await callback(data)
-                    except json.JSONDecodeError as e:
-                        logger.error("Failed to decode message", error=str(e))
-                    except Exception as e:
-                        logger.error("Error processing message", error=str(e))
-        except asyncio.CancelledError:
-            logger.info("Listener loop cancelled")
-            raise
+            lines = fields[b"d"].splitlines()
         except Exception as e:
-            logger.error("Listener loop error", error=str(e))
+            logger.error("Failed to read response entry", entry_id=entry_id, error=str(e))
+            return
+
+        for line in lines:
+            # Every response is a JSON object; skip anything else without
+            # paying for a failed parse
+            if line[:1] != b"{":
+                logger.error("Skipping malformed response frame", size=len(line))
+                continue
+            try:
+                data = orjson.loads(line)
+                logger.info("Received worker response", data=data)
+                await callback(data)
+            except orjson.JSONDecodeError as e:
+                logger.error("Failed to decode message", error=str(e))
+            except Exception as e:
+                logger.error("Error processing message", error=str(e))
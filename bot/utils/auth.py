@@ -7,6 +7,10 @@ from bot.config import settings
 
 logger = structlog.get_logger()
 
+# Read once; settings do not change at runtime
+_ALLOWED_USER_ID = settings.allowed_user_id
+_DENY_MESSAGE = "Sorry, you are not authorized to use this bot."
+
 
 def authorized_users_only(func):
     """
@@ -15,22 +19,17 @@ def authorized_users_only(func):
     """
 
     @wraps(func)
-    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
         user = update.effective_user
-        telegram_id = user.id
-
-        if telegram_id != settings.allowed_user_id:
-            logger.warning(
-                "Unauthorized access attempt",
-                telegram_id=telegram_id,
-                username=user.username,
-                allowed_user_id=settings.allowed_user_id,
-            )
-            await update.message.reply_text(
-                "Sorry, you are not authorized to use this bot."
-            )
-            return
-
-        return await func(update, context, *args, **kwargs)
+        if user.id == _ALLOWED_USER_ID:
+            return await func(update, context)
+
+        logger.warning(
+            "Unauthorized access attempt",
+            telegram_id=user.id,
+            username=user.username,
+            allowed_user_id=_ALLOWED_USER_ID,
+        )
+        await update.message.reply_text(_DENY_MESSAGE)
 
     return wrapper
@@ -1,5 +1,4 @@
 from enum import Enum
-from telegram.helpers import escape_markdown as telegram_escape_markdown
 
 
 class AIProvider(str, Enum):
@@ -9,13 +8,17 @@ class AIProvider(str, Enum):
     CLAUDE = "claude"
 
 
+# Markdown (v1) special characters, each escaped with a backslash
+_MARKDOWN_V1_ESCAPES = str.maketrans({"_": "\\_", "*": "\\*", "`": "\\`", "[": "\\["})
+
+
 def escape_markdown(text: str | None) -> str:
     """
     Escape special markdown characters for Telegram messages.
 
-    This function wraps telegram.helpers.escape_markdown() to properly escape
-    all Telegram markdown special characters, preventing unintended formatting
-    when sending dynamic content (like variable names, file paths, repository URLs,
+    Escapes the same characters as telegram.helpers.escape_markdown(version=1),
+    using a str.translate table, preventing unintended formatting when sending
+    dynamic content (like variable names, file paths, repository URLs,
     task IDs, error messages, etc.).
 
     When using parse_mode="Markdown" in Telegram messages, special characters
@@ -44,7 +47,7 @@ def escape_markdown(text: str | None) -> str:
     """
     if not text:
         return ""
-    return telegram_escape_markdown(str(text), version=1)
+    return str(text).translate(_MARKDOWN_V1_ESCAPES)
 
 
 # Telegram message limits
@@ -59,35 +62,49 @@ ERROR_MESSAGE_UNKNOWN_PROVIDER = "Unknown AI provider: {provider}"
 
 # Success messages
 MESSAGE_NEW_CONVERSATION = "Started a new conversation session.\nProvider: {provider}\nSession ID: {session_id}"
-MESSAGE_WELCOME = """Hello {first_name}!
-
-I'm Hermes, your AI assistant bot. I can connect you with both OpenAI and Anthropic Claude.
-
-Available commands:
-/chat <message> - Chat with default AI (Claude)
-/chat_gpt <message> - Chat with OpenAI GPT
-/chat_claude <message> - Chat with Anthropic Claude
-/new - Start a new conversation
-/help - Show this help message
-
-Just send me a message using any of the chat commands!"""
-
-MESSAGE_HELP = """Hermes Bot - AI Assistant
 
-Available commands:
-
-/start - Initialize the bot
-/help - Show this help message
-/new - Start a new conversation session
-
-Chat commands:
-/chat <message> - Chat with default AI (Claude)
-/chat_gpt <message> - Chat with OpenAI GPT-4
-/chat_claude <message> - Chat with Anthropic Claude
-
-Examples:
-/chat Hello, how are you?
-/chat_gpt What is the capital of France?
-/chat_claude Explain quantum computing
+# Welcome text after "Hello {first_name}"; the static part is built once
+MESSAGE_WELCOME_TAIL = (
+    "!\n\n"
+    "I'm Hermes, your AI assistant bot. I can connect you with both OpenAI and Anthropic Claude.\n\n"
+    "Available commands:\n"
+    "/chat <message> - Chat with default AI (Claude)\n"
+    "/chat_gpt <message> - Chat with OpenAI GPT\n"
+    "/chat_claude <message> - Chat with Anthropic Claude\n"
+    "/ticket <id> - Get Jira ticket summary (e.g., /ticket MS-1234)\n"
+    "/adw - Start AI-driven workflow on GitHub repo\n"
+    "/git - Manage repositories (add, list, remove)\n"
+    "/new - Start a new conversation\n"
+    "/help - Show this help message\n\n"
+    "Just send me a message using any of the chat commands!"
+)
 
-The bot maintains conversation context, so follow-up messages will remember previous messages in the same session."""
+MESSAGE_HELP = (
+    "Hermes Bot - AI Assistant\n\n"
+    "Available commands:\n\n"
+    "/start - Initialize the bot\n"
+    "/help - Show this help message\n"
+    "/new - Start a new conversation session\n\n"
+    "Chat commands:\n"
+    "/chat <message> - Chat with default AI (Claude)\n"
+    "/chat_gpt <message> - Chat with OpenAI GPT-4\n"
+    "/chat_claude <message> - Chat with Anthropic Claude\n\n"
+    "Jira integration:\n"
+    "/ticket <id> - Get AI summary of Jira ticket\n"
+    "Example: /ticket MS-1234\n\n"
+    "Repository Management:\n"
+    "/git add <short_name> <jira_prefix> <repo_url>\n"
+    "Example: /git add backend MS EcorRouge/backend-api\n"
+    "/git list - Show all your registered repositories\n"
+    "/git remove <short_name>\n"
+    "Example: /git remove backend\n\n"
+    "AI-Driven Workflows:\n"
+    "/adw [workflow:name] [repo:owner/repo] <task> [JIRA-ID]\n"
+    "Example: /adw repo:myorg/myrepo Fix login bug MS-1234\n\n"
+    "Chat examples:\n"
+    "/chat Hello, how are you?\n"
+    "/chat_gpt What is the capital of France?\n"
+    "/chat_claude Explain quantum computing\n\n"
+    "The bot maintains conversation context, so follow-up messages "
+    "will remember previous messages in the same session."
+)
@@ -1,10 +1,16 @@
 import logging
 import sys
+import orjson
 import structlog
 
 from bot.config import settings
 
 
+def _orjson_dumps(obj, **kwargs) -> str:
+    """Serialize a log event with orjson; stdlib loggers need str, not bytes."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def setup_logging():
     """Configure structured logging for the application."""
 
@@ -26,7 +32,7 @@ def setup_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
@@ -0,0 +1,35 @@
+import pytest
+
+from bot.services.adw_parser import ADWParser
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [
+        # An explicit repo:owner/name wins over an alias ending in "repo"
+        (
+            "fix MS-1 in the repo:org/x",
+            {"github_repo": "org/x", "repo_alias": None, "jira_ticket": "MS-1",
+             "task_description": "fix MS-1 in the"},
+        ),
+        (
+            "in bot repo:org/x add login",
+            {"github_repo": "org/x", "repo_alias": None, "jira_ticket": None,
+             "task_description": "in bot add login"},
+        ),
+        # A Jira ticket used as an alias is still the ticket
+        (
+            "fix in the MS-12 repo",
+            {"github_repo": None, "repo_alias": "ms-12", "jira_ticket": "MS-12",
+             "task_description": "fix"},
+        ),
+        (
+            "fix login bug in the bot repo",
+            {"github_repo": None, "repo_alias": "bot", "jira_ticket": None,
+             "task_description": "fix login bug"},
+        ),
+    ],
+)
+def test_parse_repository(command, expected):
+    result = ADWParser.parse(command)
+    assert {key: result[key] for key in expected} == expected
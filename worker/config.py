@@ -13,6 +13,14 @@ class WorkerSettings(BaseSettings):
 
     # Redis Configuration
     redis_url: str = "redis://redis:6379/0"
+    redis_batch_size: int = 32  # Max responses sent in one pipeline
+    redis_flush_ms: int = 2  # Wait for more responses before flushing a batch
+
+    # Task processing
+    task_batch_size: int = 32  # Max tasks taken from the queue in one round-trip
+    task_poll_timeout: int = 5  # Seconds a blocking queue read waits for tasks
+    worker_concurrency: int = 4  # Max clone/prime/ADW tasks processed at once
+    light_task_concurrency: int = 16  # Max cheap tasks (repository removal) at once
 
     # GitHub Configuration
     github_token: str
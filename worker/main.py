@@ -1,28 +1,223 @@
 import asyncio
-import json
+import hashlib
+import logging
 import os
-import subprocess
+import orjson
+import random
+import re
 import structlog
 import shutil
+import signal
+import socket
+import weakref
+import zlib
+from functools import lru_cache
 from pathlib import Path
-from redis.asyncio import Redis
-from redis.exceptions import RedisError
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError, TimeoutError as RedisTimeoutError
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
 
 from config import settings
 from reporting import MessageFilter, MessageCategory, ReportingLevel
+from tasks import AdwTask, GitAddTask, GitRemoveTask, Task, parse_task
 from adws.adw_modules.agent import prompt_claude_code
 from adws.adw_modules.data_types import AgentPromptRequest, AgentPromptResponse
 
 # Setup logging
 structlog.configure(
     processors=[
+        structlog.contextvars.merge_contextvars,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
         structlog.processors.JSONRenderer(),
-    ]
+    ],
+    # Calls below LOG_LEVEL are no-ops, skipping the processors and JSON
+    # rendering entirely
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelName(settings.log_level.upper())
+    ),
 )
 logger = structlog.get_logger()
 
+# Shared with the bot; bytes skip redis-py's per-command str encoding
+TASKS_QUEUE = b"adw:tasks"
+RESPONSES_STREAM = b"adw:responses"
+# Responses the bot has not read yet are kept, up to roughly this many frames
+_RESPONSES_MAXLEN = 10000
+
+# Delay before polling again after a Redis connection error, doubling (with
+# jitter) on each consecutive failure
+_POLL_BACKOFF_MIN = 0.1
+_POLL_BACKOFF_MAX = 30
+
+# Upper bound on pooled Redis connections; callers wait for a free one
+_REDIS_MAX_CONNECTIONS = 8
+
+# Let the kernel detect dead connections instead of redis-py PINGs, which
+# would queue behind the blocking pop; the tuning options are Linux-only
+_KEEPALIVE_OPTIONS = (
+    {socket.TCP_KEEPIDLE: 60, socket.TCP_KEEPINTVL: 10, socket.TCP_KEEPCNT: 3}
+    if hasattr(socket, "TCP_KEEPIDLE")
+    else {}
+)
+
+
+# git never waits for terminal input: a bad token fails at once instead of
+# hanging until the timeout; a transfer stuck below 1 KB/s for 30s is aborted
+_GIT_ENV = {
+    **os.environ,
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",
+    "GIT_HTTP_LOW_SPEED_TIME": "30",
+}
+
+# Partial clone: full commit history and all branches, but file contents
+# are only downloaded for the checked-out tree (and later on demand)
+_CLONE_ARGS = ("clone", "--filter=blob:none")
+
+
+# Clone URL with the GitHub token; formatted per repository by _auth_url
+_AUTH_URL_TEMPLATE = f"https://{settings.github_token}@github.com/{{repo}}.git"
+
+# Digest of the ADW requirements installed at image build time (Dockerfile)
+_PREINSTALLED_REQUIREMENTS = Path(__file__).parent / "adws-requirements.sha256"
+
+# Workflow progress lines arriving within this many seconds share one status
+# message; the queue is lossy and drops the oldest lines when full
+_PROGRESS_DEBOUNCE = 0.1
+_PROGRESS_QUEUE_SIZE = 256
+_PROGRESS_MAX_LINES = 10
+# Workflow output is read in chunks of this size and split into lines here,
+# so one long line cannot overrun StreamReader.readline's 64 KiB limit
+_STREAM_CHUNK_SIZE = 65536
+# Workflow output lines worth reporting to the user
+_PROGRESS_LINE_RE = re.compile(r"error|failed|completed|created", re.IGNORECASE)
+# A batched message takes the category of its most important line
+_CATEGORY_PRIORITY: tuple[MessageCategory, ...] = (
+    "error", "completion", "workflow", "agent", "technical"
+)
+
+
+@lru_cache(maxsize=256)
+def _auth_url(repo: str) -> str:
+    """
+    Return the token-authenticated clone URL for a repository.
+
+    Args:
+        repo: Repository in format "owner/repo"
+
+    Returns:
+        https URL with the GitHub token as credentials
+    """
+    return _AUTH_URL_TEMPLATE.format(repo=repo)
+
+
+async def _run(
+    cmd: list[str],
+    cwd: Path | None = None,
+    timeout: float = 60,
+    env: dict | None = None,
+) -> tuple[int, str]:
+    """
+    Run a command without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        timeout: Seconds before the process is killed
+        env: Environment for the process (defaults to the worker's)
+
+    Returns:
+        Tuple of (return code, stderr text)
+
+    Raises:
+        asyncio.TimeoutError: If the command did not finish in time
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=str(cwd) if cwd else None,
+        env=env,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        # Only the subcommand is named; later arguments may hold credentials
+        raise asyncio.TimeoutError(f"'{' '.join(cmd[:2])}' timed out after {timeout}s") from None
+    return process.returncode, stderr.decode(errors="replace")
+
+
+async def _reset_to_origin(repo_dir: Path) -> bool:
+    """
+    Bring a checkout back to a clean copy of origin/main in place.
+
+    Reuses the objects already on disk, so only new commits are fetched.
+
+    Args:
+        repo_dir: Repository directory
+
+    Returns:
+        True if every step succeeded; False means the checkout is unusable
+    """
+    steps = (
+        ("reset", "--hard", "HEAD"),
+        ("clean", "-xfd"),
+        ("fetch", "--prune", "origin"),
+        ("checkout", "-f", "main"),
+        ("reset", "--hard", "origin/main"),
+    )
+    for step in steps:
+        returncode, stderr = await _git(*step, cwd=repo_dir, timeout=300)
+        if returncode != 0:
+            logger.warning("Repository recovery step failed", step=step[0], error=stderr)
+            return False
+    return True
+
+
+async def _remove_tree(path: Path):
+    """
+    Delete a directory tree with rm -rf.
+
+    One exec of rm is much faster than shutil.rmtree's per-entry Python
+    loop on large checkouts, and it never blocks the event loop.
+
+    Args:
+        path: Directory to delete
+
+    Raises:
+        OSError: If rm fails
+    """
+    returncode, stderr = await _run(["rm", "-rf", str(path)], timeout=300)
+    if returncode != 0:
+        raise OSError(f"Failed to remove {path}: {stderr}")
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path: Path) -> str:
+    """
+    Hash a file that does not change while the worker runs.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest of the file contents
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+async def _git(*args: str, cwd: Path | None = None, timeout: float = 60) -> tuple[int, str]:
+    """Run a non-interactive git command; see _run."""
+    return await _run(["git", *args], cwd=cwd, timeout=timeout, env=_GIT_ENV)
+
 
 class WorkerService:
     """Worker service that processes ADW tasks."""
@@ -30,18 +225,78 @@ class WorkerService:
     def __init__(self):
         self.redis: Redis = None
         self.running = False
+        self.batch_size = settings.redis_batch_size
+        self.flush_interval = settings.redis_flush_ms / 1000
+        self._publish_queue: asyncio.Queue = asyncio.Queue()
+        self._publisher_task = None
+        # Heavy tasks compete for disk, network and CPU; cheap ones should not
+        # queue behind them, so each class has its own slots
+        self._heavy_in_flight: set[asyncio.Task] = set()
+        self._light_in_flight: set[asyncio.Task] = set()
+        # One lock per repository checkout, dropped once no task holds it
+        self._repo_locks: weakref.WeakValueDictionary[Path, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # Directories already created, so repeat tasks skip the mkdir syscalls
+        self._known_dirs: set[Path] = set()
+        # Digests of ADW requirements files already pip-installed by this worker
+        self._installed_requirements: set[str] = set()
+        if _PREINSTALLED_REQUIREMENTS.exists():
+            self._installed_requirements.add(_PREINSTALLED_REQUIREMENTS.read_text().strip())
         self.workspace = Path(settings.workspace_dir)
-        self.workspace.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.workspace)
+
+    def _ensure_dir(self, path: Path):
+        """
+        Create a directory (and parents) unless this worker already has.
+
+        Only use for directories the worker never deletes, such as the
+        workspace and per-user directories.
+
+        Args:
+            path: Directory to create
+        """
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+
+    def _repo_lock(self, repo_dir: Path) -> asyncio.Lock:
+        """
+        Get the lock that serializes every task touching one checkout.
+
+        Args:
+            repo_dir: Repository directory
+
+        Returns:
+            Lock shared by all tasks on the same resolved directory
+        """
+        key = repo_dir.resolve()
+        lock = self._repo_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._repo_locks[key] = lock
+        return lock
 
     async def connect(self):
         """Connect to Redis."""
         try:
-            self.redis = Redis.from_url(
+            # Raw bytes in and out; payloads are orjson-encoded. A bounded,
+            # blocking pool reuses the few connections the worker needs (the
+            # queue pop and the response publisher) instead of opening new
+            # ones under bursts
+            pool = BlockingConnectionPool.from_url(
                 settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True
+                max_connections=_REDIS_MAX_CONNECTIONS,
+                timeout=2,
+                health_check_interval=0,
+                socket_keepalive=True,
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                socket_timeout=None,
+                retry_on_timeout=False,
             )
+            self.redis = Redis(connection_pool=pool)
             await self.redis.ping()
+            self._publisher_task = asyncio.create_task(self._response_publisher())
             logger.info("Connected to Redis", url=settings.redis_url)
         except RedisError as e:
             logger.error("Failed to connect to Redis", error=str(e))
@@ -49,10 +304,77 @@ class WorkerService:
 
     async def disconnect(self):
         """Disconnect from Redis."""
+        if self._publisher_task:
+            try:
+                await asyncio.wait_for(self.flush(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Dropping unsent responses",
+                    count=self._publish_queue.qsize()
+                )
+            self._publisher_task.cancel()
+            try:
+                await self._publisher_task
+            except asyncio.CancelledError:
+                pass
+
         if self.redis:
-            await self.redis.close()
+            await self.redis.close(close_connection_pool=True)
             logger.info("Disconnected from Redis")
 
+    def _publish_response(self, response: dict):
+        """
+        Queue a response for the bot.
+
+        Responses are published in order by _response_publisher, which
+        sends everything queued within the flush interval as one frame.
+
+        Args:
+            response: Response payload
+        """
+        self._publish_queue.put_nowait(
+            orjson.dumps(response, option=orjson.OPT_APPEND_NEWLINE)
+        )
+
+    async def flush(self):
+        """Wait until every queued response has been published."""
+        await self._publish_queue.join()
+
+    async def _response_publisher(self):
+        """
+        Drain queued responses and append each batch as one stream entry.
+
+        A frame is newline-delimited JSON: one response per line. orjson
+        escapes newlines inside strings, so lines never split a response.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._publish_queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._publish_queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.redis.xadd(
+                    RESPONSES_STREAM,
+                    {b"d": b"".join(batch)},
+                    maxlen=_RESPONSES_MAXLEN,
+                    approximate=True,
+                )
+            except Exception as e:
+                logger.error("Failed to publish responses", error=str(e), count=len(batch))
+            finally:
+                for _ in batch:
+                    self._publish_queue.task_done()
+
     async def send_status(
         self,
         task_id: str,
@@ -74,17 +396,17 @@ class WorkerService:
             category: Message category (auto-detected if None)
         """
         try:
-            # Auto-categorize message if category not provided
-            if category is None:
-                category = MessageFilter.categorize_message(message)
-
             # Filter progress and started messages based on reporting level
             # Always send finished and failed status messages
             if status in ("progress", "started"):
-                if not MessageFilter.should_send_message(message, reporting_level, category):
+                # Auto-categorize message if category not provided
+                if category is None:
+                    category, send = MessageFilter.classify(message, reporting_level)
+                else:
+                    send = MessageFilter.should_send_message(message, reporting_level, category)
+                if not send:
                     logger.debug(
                         "Filtered message",
-                        task_id=task_id,
                         category=category,
                         reporting_level=reporting_level
                     )
@@ -96,48 +418,55 @@ class WorkerService:
                 "status": status,
                 "message": message
             }
-            await self.redis.publish("adw:responses", json.dumps(response))
-            logger.info("Sent status update", task_id=task_id, status=status)
+            self._publish_response(response)
+            logger.info("Queued status update", status=status)
         except Exception as e:
-            logger.error("Failed to send status update", task_id=task_id, error=str(e))
+            logger.error("Failed to send status update", error=str(e))
 
-    async def process_task(self, task_data: dict):
+    async def process_task(self, task: Task):
         """
         Process a task from Redis queue.
 
         Args:
-            task_data: Task data from Redis queue
+            task: Typed task from Redis queue
         """
-        task_id = task_data.get("task_id")
-        operation = task_data.get("operation", "adw")
-
-        logger.info("Processing task", task_id=task_id, operation=operation)
+        # Every log line for this task carries its ids; each task runs in
+        # its own asyncio task, so the binding does not leak between tasks
+        structlog.contextvars.bind_contextvars(
+            task_id=task.task_id,
+            telegram_id=task.telegram_id,
+            operation=type(task).__name__,
+        )
+        try:
+            logger.info("Processing task")
 
-        # Route to appropriate handler
-        if operation == "git_add":
-            await self.handle_git_add(task_data)
-        elif operation == "git_remove":
-            await self.handle_git_remove(task_data)
-        else:
-            await self.handle_adw_task(task_data)
+            # Route to appropriate handler
+            if isinstance(task, GitAddTask):
+                await self.handle_git_add(task)
+            elif isinstance(task, GitRemoveTask):
+                await self.handle_git_remove(task)
+            else:
+                await self.handle_adw_task(task)
+        finally:
+            structlog.contextvars.clear_contextvars()
 
-    async def handle_adw_task(self, task_data: dict):
+    async def handle_adw_task(self, task: AdwTask):
         """
         Process an ADW (AI-Driven Workflow) task.
 
         Args:
-            task_data: Task data from Redis queue
+            task: ADW task from Redis queue
         """
-        task_id = task_data.get("task_id")
-        telegram_id = task_data.get("telegram_id")
-        workflow_name = task_data.get("workflow_name", "plan_build")
-        repo_url = task_data.get("repo_url")
-        task_description = task_data.get("task_description")
-        jira_ticket = task_data.get("jira_ticket")
-        jira_details = task_data.get("jira_details")
-        reporting_level = task_data.get("reporting_level", "basic")
+        task_id = task.task_id
+        telegram_id = task.telegram_id
+        workflow_name = task.workflow_name
+        repo_url = task.repo_url
+        task_description = task.task_description
+        jira_ticket = task.jira_ticket
+        jira_details = task.jira_details
+        reporting_level = task.reporting_level
 
-        logger.info("Processing ADW task", task_id=task_id, workflow=workflow_name, reporting_level=reporting_level)
+        logger.info("Processing ADW task", workflow=workflow_name, reporting_level=reporting_level)
 
         try:
             # Send started status
@@ -151,72 +480,84 @@ class WorkerService:
 
             # Prepare workspace for this task (use telegram_id subdirectory)
             user_workspace = self.workspace / str(telegram_id)
-            user_workspace.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(user_workspace)
 
-            # Determine repository directory name
-            repo_name = repo_url.split("/")[-1].replace(".git", "")
-            repo_dir = user_workspace / repo_name
+            # Same directory setup_repository clones into
+            repo_dir = user_workspace / repo_url.rsplit("/", 1)[-1]
 
-            # Clone or update repository
-            repo_dir = await self.setup_repository(
-                repo_url,
-                user_workspace,
-                task_id,
-                telegram_id,
-                reporting_level
-            )
+            # One task at a time per checkout: concurrent checkouts, resets
+            # and script copies in one directory corrupt each other
+            repo_lock = self._repo_lock(repo_dir)
+            if repo_lock.locked():
+                await self.send_status(
+                    task_id,
+                    telegram_id,
+                    "progress",
+                    "Waiting for another task on this repository to finish...",
+                    reporting_level,
+                    "workflow"
+                )
+            async with repo_lock:
+                # Clone or update repository
+                repo_dir = await self.setup_repository(
+                    repo_url,
+                    user_workspace,
+                    task_id,
+                    telegram_id,
+                    reporting_level
+                )
 
-            await self.send_status(
-                task_id,
-                telegram_id,
-                "progress",
-                "Repository setup complete. Copying ADW scripts...",
-                reporting_level,
-                "technical"
-            )
+                await self.send_status(
+                    task_id,
+                    telegram_id,
+                    "progress",
+                    "Repository setup complete. Copying ADW scripts...",
+                    reporting_level,
+                    "technical"
+                )
 
-            # Copy ADW scripts to target repository
-            await self.copy_adw_scripts(repo_dir, task_id, telegram_id, reporting_level)
+                # Copy ADW scripts to target repository
+                await self.copy_adw_scripts(repo_dir, task_id, telegram_id, reporting_level)
 
-            await self.send_status(
-                task_id,
-                telegram_id,
-                "progress",
-                "Copying Claude commands...",
-                reporting_level,
-                "technical"
-            )
+                await self.send_status(
+                    task_id,
+                    telegram_id,
+                    "progress",
+                    "Copying Claude commands...",
+                    reporting_level,
+                    "technical"
+                )
 
-            # Copy Claude commands to target repository
-            await self.copy_claude_commands(repo_dir, task_id, telegram_id, reporting_level)
+                # Copy Claude commands to target repository
+                await self.copy_claude_commands(repo_dir, task_id, telegram_id, reporting_level)
 
-            # Prepare task input file
-            await self.prepare_task_input(
-                repo_dir,
-                task_id,
-                task_description,
-                jira_ticket,
-                jira_details,
-                telegram_id
-            )
+                # Prepare task input file
+                await self.prepare_task_input(
+                    repo_dir,
+                    task_id,
+                    task_description,
+                    jira_ticket,
+                    jira_details,
+                    telegram_id
+                )
 
-            await self.send_status(
-                task_id,
-                telegram_id,
-                "progress",
-                f"Running ADW workflow: {workflow_name}...",
-                reporting_level,
-                "workflow"
-            )
+                await self.send_status(
+                    task_id,
+                    telegram_id,
+                    "progress",
+                    f"Running ADW workflow: {workflow_name}...",
+                    reporting_level,
+                    "workflow"
+                )
 
-            # Execute ADW workflow
-            await self.execute_adw_workflow(
-                repo_dir,
-                task_id,
-                workflow_name,
-                telegram_id,
-                reporting_level
-            )
+                # Execute ADW workflow
+                await self.execute_adw_workflow(
+                    repo_dir,
+                    task_id,
+                    workflow_name,
+                    telegram_id,
+                    reporting_level
+                )
 
             # Send finished status
             await self.send_status(
@@ -227,10 +568,10 @@ class WorkerService:
                 reporting_level
             )
 
-            logger.info("Task completed", task_id=task_id)
+            logger.info("Task completed")
 
         except Exception as e:
-            logger.error("Task failed", task_id=task_id, error=str(e))
+            logger.error("Task failed", error=str(e))
             await self.send_status(
                 task_id,
                 telegram_id,
@@ -276,27 +617,33 @@ class WorkerService:
 
             # Remove existing ADW directory if present
             if adws_target.exists():
-                shutil.rmtree(adws_target)
+                await _remove_tree(adws_target)
 
             # Copy ADW scripts
-            shutil.copytree(adws_source, adws_target)
+            await asyncio.to_thread(shutil.copytree, adws_source, adws_target)
 
             logger.info("Copied ADW scripts", source=str(adws_source), target=str(adws_target))
 
             # Install ADW dependencies in the target repository
+            # Every repository gets the same requirements, installed into
+            # the worker's environment, so install each version only once
             adw_requirements = adws_target / "requirements.txt"
             if adw_requirements.exists():
+                digest = _file_digest(adws_source / "requirements.txt")
+                if digest in self._installed_requirements:
+                    logger.debug("ADW dependencies already installed")
+                    return
+
                 logger.info("Installing ADW dependencies")
-                result = subprocess.run(
+                returncode, stderr = await _run(
                     ["pip", "install", "-q", "-r", str(adw_requirements)],
-                    capture_output=True,
-                    text=True,
                     timeout=60
                 )
-                if result.returncode != 0:
-                    logger.warning(f"Failed to install ADW dependencies: {result.stderr}")
+                if returncode != 0:
+                    logger.warning(f"Failed to install ADW dependencies: {stderr}")
                     # Don't raise - dependencies might already be installed
                 else:
+                    self._installed_requirements.add(digest)
                     logger.info("ADW dependencies installed successfully")
 
         except Exception as e:
@@ -359,7 +706,7 @@ class WorkerService:
 
             # Copy Claude commands
             logger.info("Copying Claude commands", source=str(claude_source), target=str(claude_target))
-            shutil.copytree(claude_source, claude_target)
+            await asyncio.to_thread(shutil.copytree, claude_source, claude_target)
 
             logger.info("Claude commands copied successfully", target=str(claude_target))
 
@@ -394,8 +741,10 @@ class WorkerService:
             if jira_details:
                 task_title = jira_details.get("summary", "Task")
             else:
-                # Extract first line or first 50 chars as title
-                task_title = task_description.split("\n")[0][:50]
+                # Extract first line or first 50 chars as title, scanning
+                # no further than that
+                end = task_description.find("\n", 0, 50)
+                task_title = task_description[:end if end != -1 else 50]
 
             # Prepare task input data
             task_input = {
@@ -410,8 +759,7 @@ class WorkerService:
 
             # Write task input file
             task_input_file = repo_dir / "adws" / "task_input.json"
-            with open(task_input_file, "w") as f:
-                json.dump(task_input, f, indent=2)
+            task_input_file.write_bytes(orjson.dumps(task_input, option=orjson.OPT_INDENT_2))
 
             logger.info("Prepared task input", file=str(task_input_file))
 
@@ -474,46 +822,109 @@ class WorkerService:
                 cwd=str(repo_dir),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={**os.environ}
+                # Own process group, so cancelling the task also stops
+                # everything the workflow started (Claude Code, git, ...)
+                start_new_session=True
             )
 
+            progress: asyncio.Queue = asyncio.Queue(maxsize=_PROGRESS_QUEUE_SIZE)
+
+            def queue_progress(item):
+                """Queue a progress line, dropping the oldest one when full."""
+                if progress.full():
+                    progress.get_nowait()
+                progress.put_nowait(item)
+
+            async def send_progress():
+                """Send queued progress lines as debounced status messages."""
+                loop = asyncio.get_running_loop()
+                finished = False
+                while not finished:
+                    batch = [await progress.get()]
+                    deadline = loop.time() + _PROGRESS_DEBOUNCE
+                    while batch[-1] is not None:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(progress.get(), timeout))
+                        except asyncio.TimeoutError:
+                            break
+
+                    if batch[-1] is None:
+                        batch.pop()
+                        finished = True
+                    if batch:
+                        await self.send_status(
+                            task_id,
+                            telegram_id,
+                            "progress",
+                            "\n".join(text for text, _ in batch[-_PROGRESS_MAX_LINES:]),
+                            reporting_level,
+                            min((category for _, category in batch), key=_CATEGORY_PRIORITY.index)
+                        )
+
             # Stream output and send progress updates
             async def read_stream(stream, is_stderr=False):
-                """Read stream and log output."""
+                """Read stream in chunks, log its lines and report important ones."""
+                log = logger.error if is_stderr else logger.info
+                event = "ADW stderr" if is_stderr else "ADW stdout"
+                tail = b""
                 while True:
-                    line = await stream.readline()
-                    if not line:
+                    chunk = await stream.read(_STREAM_CHUNK_SIZE)
+                    if chunk:
+                        # Keep a partial last line for the next chunk
+                        lines = (tail + chunk).split(b"\n")
+                        tail = lines.pop()
+                    else:
+                        lines = [tail]
+
+                    texts = [
+                        text for text in (line.decode(errors="replace").strip() for line in lines)
+                        if text
+                    ]
+                    if texts:
+                        # One log entry per chunk rather than per line
+                        log(event, lines=texts)
+
+                    for text in texts:
+                        # Report important lines, filtered one by one so a
+                        # batch only holds lines the user asked to see
+                        if _PROGRESS_LINE_RE.search(text):
+                            text = text[:200]  # Limit message length
+                            category, send = MessageFilter.classify(text, reporting_level)
+                            if send:
+                                queue_progress((text, category))
+
+                    if not chunk:
                         break
-                    text = line.decode().strip()
-                    if text:
-                        if is_stderr:
-                            logger.error("ADW stderr", line=text)
-                        else:
-                            logger.info("ADW stdout", line=text)
-
-                        # Send progress for important lines
-                        if any(keyword in text.lower() for keyword in ["error", "failed", "completed", "created"]):
-                            await self.send_status(
-                                task_id,
-                                telegram_id,
-                                "progress",
-                                text[:200],  # Limit message length
-                                reporting_level
-                            )
-
-            # Read both streams concurrently
-            await asyncio.gather(
-                read_stream(process.stdout, False),
-                read_stream(process.stderr, True)
-            )
 
-            # Wait for process to complete
-            return_code = await process.wait()
+            try:
+                # Read both streams concurrently
+                sender = asyncio.create_task(send_progress())
+                try:
+                    await asyncio.gather(
+                        read_stream(process.stdout, False),
+                        read_stream(process.stderr, True)
+                    )
+                finally:
+                    queue_progress(None)
+                await sender
+
+                # Wait for process to complete
+                return_code = await process.wait()
+            except asyncio.CancelledError:
+                logger.warning("ADW workflow cancelled, terminating process group")
+                try:
+                    os.killpg(process.pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+                raise
 
             if return_code != 0:
                 raise Exception(f"Workflow script failed with exit code {return_code}")
 
-            logger.info("ADW workflow completed successfully", task_id=task_id)
+            logger.info("ADW workflow completed successfully")
 
         except Exception as e:
             logger.error("Failed to execute ADW workflow", error=str(e))
@@ -530,6 +941,9 @@ class WorkerService:
         """
         Clone or update a GitHub repository.
 
+        Callers must hold the checkout's _repo_lock; recovery resets or
+        deletes the directory and is refused without it.
+
         Args:
             github_repo: Repository in format "owner/repo"
             task_workspace: Task workspace directory
@@ -540,7 +954,7 @@ class WorkerService:
         Returns:
             Path to repository directory
         """
-        repo_dir = task_workspace / github_repo.split("/")[-1]
+        repo_dir = task_workspace / github_repo.rsplit("/", 1)[-1]
 
         try:
             if repo_dir.exists():
@@ -567,33 +981,27 @@ class WorkerService:
                         "technical"
                     )
 
-                    checkout_result = subprocess.run(
-                        ["git", "checkout", "main"],
-                        cwd=repo_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
+                    returncode, stderr = await _git("checkout", "main", cwd=repo_dir)
 
-                    if checkout_result.returncode != 0:
-                        raise Exception(f"Git checkout failed: {checkout_result.stderr}")
+                    if returncode != 0:
+                        raise Exception(f"Git checkout failed: {stderr}")
 
                     # Pull latest changes
-                    pull_result = subprocess.run(
-                        ["git", "pull"],
-                        cwd=repo_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
+                    returncode, stderr = await _git("pull", cwd=repo_dir)
 
-                    if pull_result.returncode != 0:
-                        raise Exception(f"Git pull failed: {pull_result.stderr}")
+                    if returncode != 0:
+                        raise Exception(f"Git pull failed: {stderr}")
 
                 except Exception as git_error:
-                    # Git operations failed, remove directory and re-clone
+                    if not self._repo_lock(repo_dir).locked():
+                        # Another task may be working in this checkout
+                        raise RuntimeError(
+                            "Refusing to recover a repository without its lock"
+                        ) from git_error
+
+                    # Git operations failed, reset the checkout to origin/main
                     logger.warning(
-                        "Git operations failed, removing and re-cloning",
+                        "Git operations failed, recovering repository",
                         repo=github_repo,
                         error=str(git_error)
                     )
@@ -606,7 +1014,13 @@ class WorkerService:
                         "technical"
                     )
 
-                    shutil.rmtree(repo_dir)
+                    if await _reset_to_origin(repo_dir):
+                        logger.info("Recovered repository in place", repo=github_repo)
+                        return repo_dir
+
+                    # The checkout itself is broken, remove directory and re-clone
+                    logger.warning("In-place recovery failed, re-cloning", repo=github_repo)
+                    await _remove_tree(repo_dir)
 
                     # Fall through to clone logic below
                     logger.info("Cloning repository after recovery", repo=github_repo)
@@ -619,18 +1033,12 @@ class WorkerService:
                         "technical"
                     )
 
-                    # Prepare git URL with token
-                    repo_url = f"https://{settings.github_token}@github.com/{github_repo}.git"
-
-                    result = subprocess.run(
-                        ["git", "clone", repo_url, str(repo_dir)],
-                        capture_output=True,
-                        text=True,
-                        timeout=300
+                    returncode, stderr = await _git(
+                        *_CLONE_ARGS, _auth_url(github_repo), str(repo_dir), timeout=300
                     )
 
-                    if result.returncode != 0:
-                        raise Exception(f"Git clone failed: {result.stderr}")
+                    if returncode != 0:
+                        raise Exception(f"Git clone failed: {stderr}")
             else:
                 # Clone repository
                 logger.info("Cloning repository", repo=github_repo)
@@ -643,18 +1051,12 @@ class WorkerService:
                     "technical"
                 )
 
-                # Prepare git URL with token
-                repo_url = f"https://{settings.github_token}@github.com/{github_repo}.git"
-
-                result = subprocess.run(
-                    ["git", "clone", repo_url, str(repo_dir)],
-                    capture_output=True,
-                    text=True,
-                    timeout=300
+                returncode, stderr = await _git(
+                    *_CLONE_ARGS, _auth_url(github_repo), str(repo_dir), timeout=300
                 )
 
-                if result.returncode != 0:
-                    raise Exception(f"Git clone failed: {result.stderr}")
+                if returncode != 0:
+                    raise Exception(f"Git clone failed: {stderr}")
 
             logger.info("Repository ready", repo=github_repo, path=repo_dir)
             return repo_dir
@@ -663,238 +1065,231 @@ class WorkerService:
             logger.error("Failed to setup repository", repo=github_repo, error=str(e))
             raise
 
-    async def handle_git_add(self, task_data: dict):
+    async def handle_git_add(self, task: GitAddTask):
         """
         Handle git add operation (clone + prime).
 
         Args:
-            task_data: Task data from Redis queue
+            task: Git add task from Redis queue
         """
-        task_id = task_data.get("task_id")
-        telegram_id = task_data.get("telegram_id")
-        short_name = task_data.get("short_name")
-        repo_url = task_data.get("repo_url")
-        full_url = task_data.get("full_url")
-        repo_id = task_data.get("repo_id")
+        task_id = task.task_id
+        telegram_id = task.telegram_id
+        short_name = task.short_name
+        repo_url = task.repo_url
+        full_url = task.full_url
+        repo_id = task.repo_id
 
-        logger.info("Adding repository (clone + prime)", task_id=task_id, repo_url=repo_url)
+        logger.info("Adding repository (clone + prime)", repo_url=repo_url)
 
-        try:
-            # Create directory for this repository using short_name
-            repo_dir = self.workspace / f"{telegram_id}" / short_name
-            repo_dir.parent.mkdir(parents=True, exist_ok=True)
-
-            if repo_dir.exists():
-                # Repository directory already exists
-                logger.warning("Repository directory already exists", path=repo_dir)
-                await self.send_git_response(
-                    task_id,
-                    telegram_id,
-                    "failed",
-                    f"Repository directory '{short_name}' already exists",
-                    "git_add",
-                    repo_id
-                )
-                return
+        # Create directory for this repository using short_name
+        repo_dir = self.workspace / f"{telegram_id}" / short_name
 
-            # Clone repository with authentication
-            clone_url = full_url.replace(
-                "https://github.com/",
-                f"https://{settings.github_token}@github.com/"
-            )
-
-            logger.info("Cloning repository", repo_url=repo_url)
-            result = subprocess.run(
-                ["git", "clone", clone_url, str(repo_dir)],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr or "Clone failed"
-                await self.send_git_response(
-                    task_id,
-                    telegram_id,
-                    "failed",
-                    f"Clone failed: {error_msg}",
-                    "git_add",
-                    repo_id
-                )
-                logger.error("Clone failed", error=error_msg)
-                return
+        async with self._repo_lock(repo_dir):
+            try:
+                self._ensure_dir(repo_dir.parent)
 
-            logger.info("Repository cloned successfully, running /prime", repo_url=repo_url)
+                if repo_dir.exists():
+                    # Repository directory already exists
+                    logger.warning("Repository directory already exists", path=repo_dir)
+                    await self.send_git_response(
+                        task_id,
+                        telegram_id,
+                        "failed",
+                        f"Repository directory '{short_name}' already exists",
+                        "git_add",
+                        repo_id
+                    )
+                    return
 
-            # Copy Claude commands to repository
-            logger.info("Copying Claude commands to repository", repo_url=repo_url)
-            try:
-                await self.copy_claude_commands(repo_dir, task_id, telegram_id, "basic")
-            except Exception as e:
-                await self.send_git_response(
-                    task_id,
-                    telegram_id,
-                    "failed",
-                    f"Failed to copy Claude commands: {str(e)}",
-                    "git_add",
-                    repo_id
-                )
-                logger.error("Failed to copy Claude commands", error=str(e))
-                return
+                # Clone repository with authentication
+                repo = full_url.removeprefix("https://github.com/").removesuffix(".git")
+                clone_url = _auth_url(repo)
 
-            # Run Claude Code with /prime command using agent module
-            try:
-                # Create output directory for prime JSONL files
-                prime_dir = repo_dir / "prime"
-                prime_dir.mkdir(exist_ok=True)
-                output_file = str(prime_dir / "prime_output.jsonl")
-
-                # Build AgentPromptRequest
-                request = AgentPromptRequest(
-                    prompt="/prime",
-                    adw_id=task_id,
-                    agent_name="git_prime",
-                    model="sonnet",
-                    dangerously_skip_permissions=True,
-                    output_file=output_file
+                logger.info("Cloning repository", repo_url=repo_url)
+                returncode, stderr = await _git(
+                    *_CLONE_ARGS, clone_url, str(repo_dir), timeout=300
                 )
 
-                logger.info("Running prime with agent module", output_file=output_file)
+                if returncode != 0:
+                    error_msg = stderr or "Clone failed"
+                    await self.send_git_response(
+                        task_id,
+                        telegram_id,
+                        "failed",
+                        f"Clone failed: {error_msg}",
+                        "git_add",
+                        repo_id
+                    )
+                    logger.error("Clone failed", error=error_msg)
+                    return
 
-                # Change to repository directory and run prime
-                original_cwd = os.getcwd()
-                os.chdir(str(repo_dir))
+                logger.info("Repository cloned successfully, running /prime", repo_url=repo_url)
 
+                # Copy Claude commands to repository
+                logger.info("Copying Claude commands to repository", repo_url=repo_url)
                 try:
-                    response = prompt_claude_code(request)
-                finally:
-                    os.chdir(original_cwd)
-
-                # Handle response
-                if response.success:
-                    prime_output = response.output
-
+                    await self.copy_claude_commands(repo_dir, task_id, telegram_id, "basic")
+                except Exception as e:
                     await self.send_git_response(
                         task_id,
                         telegram_id,
-                        "success",
-                        f"Repository added and primed successfully: {short_name}",
+                        "failed",
+                        f"Failed to copy Claude commands: {str(e)}",
                         "git_add",
-                        repo_id,
-                        prime_output
+                        repo_id
                     )
-                    logger.info("Repository primed successfully", repo_url=repo_url, session_id=response.session_id, prime_output=prime_output)
-                else:
-                    error_msg = response.output or "Prime failed"
+                    logger.error("Failed to copy Claude commands", error=str(e))
+                    return
+
+                # Run Claude Code with /prime command using agent module
+                try:
+                    # Create output directory for prime JSONL files
+                    prime_dir = repo_dir / "prime"
+                    prime_dir.mkdir(exist_ok=True)
+                    output_file = str(prime_dir / "prime_output.jsonl")
+
+                    # Build AgentPromptRequest
+                    request = AgentPromptRequest(
+                        prompt="/prime",
+                        adw_id=task_id,
+                        agent_name="git_prime",
+                        model="sonnet",
+                        dangerously_skip_permissions=True,
+                        output_file=output_file,
+                        cwd=str(repo_dir)
+                    )
+
+                    logger.info("Running prime with agent module", output_file=output_file)
+
+                    # Run prime from the repository directory without blocking the loop
+                    response = await asyncio.to_thread(prompt_claude_code, request)
+
+                    # Handle response
+                    if response.success:
+                        prime_output = response.output
+
+                        await self.send_git_response(
+                            task_id,
+                            telegram_id,
+                            "success",
+                            f"Repository added and primed successfully: {short_name}",
+                            "git_add",
+                            repo_id,
+                            prime_output
+                        )
+                        logger.info("Repository primed successfully", repo_url=repo_url, session_id=response.session_id, prime_output=prime_output)
+                    else:
+                        error_msg = response.output or "Prime failed"
+                        await self.send_git_response(
+                            task_id,
+                            telegram_id,
+                            "failed",
+                            f"Repository cloned but prime failed: {error_msg}",
+                            "git_add",
+                            repo_id
+                        )
+                        logger.error("Prime failed", error=error_msg)
+
+                except Exception as e:
                     await self.send_git_response(
                         task_id,
                         telegram_id,
                         "failed",
-                        f"Repository cloned but prime failed: {error_msg}",
+                        f"Repository cloned but prime operation failed: {str(e)}",
                         "git_add",
                         repo_id
                     )
-                    logger.error("Prime failed", error=error_msg)
+                    logger.error("Prime exception", repo_url=repo_url, error=str(e))
 
+            except asyncio.TimeoutError:
+                await self.send_git_response(
+                    task_id,
+                    telegram_id,
+                    "failed",
+                    "Clone operation timed out",
+                    "git_add",
+                    repo_id
+                )
+                logger.error("Clone timeout", repo_url=repo_url)
             except Exception as e:
                 await self.send_git_response(
                     task_id,
                     telegram_id,
                     "failed",
-                    f"Repository cloned but prime operation failed: {str(e)}",
+                    f"Add operation error: {str(e)}",
                     "git_add",
                     repo_id
                 )
-                logger.error("Prime exception", repo_url=repo_url, error=str(e))
-
-        except subprocess.TimeoutExpired:
-            await self.send_git_response(
-                task_id,
-                telegram_id,
-                "failed",
-                "Clone operation timed out",
-                "git_add",
-                repo_id
-            )
-            logger.error("Clone timeout", repo_url=repo_url)
-        except Exception as e:
-            await self.send_git_response(
-                task_id,
-                telegram_id,
-                "failed",
-                f"Add operation error: {str(e)}",
-                "git_add",
-                repo_id
-            )
-            logger.error("Add error", error=str(e))
+                logger.error("Add error", error=str(e))
 
 
-    async def handle_git_remove(self, task_data: dict):
+    async def handle_git_remove(self, task: GitRemoveTask):
         """
         Handle git remove operation (delete repository directory).
 
         Args:
-            task_data: Task data from Redis queue
+            task: Git remove task from Redis queue
         """
-        task_id = task_data.get("task_id")
-        telegram_id = task_data.get("telegram_id")
-        short_name = task_data.get("short_name")
-        repo_id = task_data.get("repo_id")
+        task_id = task.task_id
+        telegram_id = task.telegram_id
+        short_name = task.short_name
+        repo_id = task.repo_id
 
-        logger.info("Removing repository", task_id=task_id, short_name=short_name)
+        logger.info("Removing repository", short_name=short_name)
 
-        try:
-            # Construct repository directory path
-            repo_dir = self.workspace / str(telegram_id) / short_name
+        # Construct repository directory path
+        repo_dir = self.workspace / str(telegram_id) / short_name
 
-            # Check if directory exists
-            if repo_dir.exists():
-                logger.info("Removing repository directory", path=repo_dir)
+        async with self._repo_lock(repo_dir):
+            try:
+                # Check if directory exists
+                if repo_dir.exists():
+                    logger.info("Removing repository directory", path=repo_dir)
+
+                    # Remove directory recursively
+                    await _remove_tree(repo_dir)
 
-                # Remove directory recursively
-                shutil.rmtree(repo_dir)
+                    await self.send_git_response(
+                        task_id,
+                        telegram_id,
+                        "success",
+                        f"Repository '{short_name}' removed successfully (database and filesystem)",
+                        "git_remove",
+                        repo_id
+                    )
+                    logger.info("Repository removed successfully", short_name=short_name)
+                else:
+                    # Directory doesn't exist, but that's okay
+                    logger.warning("Repository directory not found, already cleaned up", path=repo_dir)
+                    await self.send_git_response(
+                        task_id,
+                        telegram_id,
+                        "success",
+                        f"Repository '{short_name}' removed from database (directory was already cleaned up)",
+                        "git_remove",
+                        repo_id
+                    )
 
+            except PermissionError as e:
                 await self.send_git_response(
                     task_id,
                     telegram_id,
-                    "success",
-                    f"Repository '{short_name}' removed successfully (database and filesystem)",
+                    "failed",
+                    f"Permission denied while removing '{short_name}': {str(e)}",
                     "git_remove",
                     repo_id
                 )
-                logger.info("Repository removed successfully", short_name=short_name)
-            else:
-                # Directory doesn't exist, but that's okay
-                logger.warning("Repository directory not found, already cleaned up", path=repo_dir)
+                logger.error("Permission error removing repository", short_name=short_name, error=str(e))
+            except Exception as e:
                 await self.send_git_response(
                     task_id,
                     telegram_id,
-                    "success",
-                    f"Repository '{short_name}' removed from database (directory was already cleaned up)",
+                    "failed",
+                    f"Failed to remove '{short_name}': {str(e)}",
                     "git_remove",
                     repo_id
                 )
-
-        except PermissionError as e:
-            await self.send_git_response(
-                task_id,
-                telegram_id,
-                "failed",
-                f"Permission denied while removing '{short_name}': {str(e)}",
-                "git_remove",
-                repo_id
-            )
-            logger.error("Permission error removing repository", short_name=short_name, error=str(e))
-        except Exception as e:
-            await self.send_git_response(
-                task_id,
-                telegram_id,
-                "failed",
-                f"Failed to remove '{short_name}': {str(e)}",
-                "git_remove",
-                repo_id
-            )
-            logger.error("Error removing repository", short_name=short_name, error=str(e))
+                logger.error("Error removing repository", short_name=short_name, error=str(e))
 
     async def send_git_response(
         self,
@@ -929,35 +1324,138 @@ class WorkerService:
             }
             if prime_output is not None:
                 response["prime_output"] = prime_output
-            await self.redis.publish("adw:responses", json.dumps(response))
-            logger.info("Sent git response", task_id=task_id, status=status)
+            self._publish_response(response)
+            logger.info("Queued git response", status=status)
+        except Exception as e:
+            logger.error("Failed to send git response", error=str(e))
+
+    async def _next_tasks(self, count: int) -> list[bytes]:
+        """
+        Take the next batch of raw tasks from the queue, oldest first.
+
+        BLMPOP (Redis 7) returns up to count tasks at once as soon as the
+        queue is non-empty, and otherwise waits up to task_poll_timeout
+        seconds, so a burst arriving on an idle queue is still taken in one
+        round-trip. The connection has no socket timeout, so the read is
+        never cut short client-side; task_poll_timeout also bounds how long
+        stop() waits for the loop to notice.
+
+        Args:
+            count: Maximum number of tasks to take
+
+        Returns:
+            Raw task payloads, possibly empty
+        """
+        result = await self.redis.execute_command(
+            "BLMPOP", settings.task_poll_timeout, 1, TASKS_QUEUE, "RIGHT", "COUNT", count
+        )
+        return result[1] if result else []
+
+    @staticmethod
+    def _decode_task(task_json: bytes) -> Task | None:
+        """
+        Decode one raw task payload.
+
+        Args:
+            task_json: Raw task payload from Redis
+
+        Returns:
+            Parsed task, or None if the payload is malformed
+        """
+        try:
+            if task_json[:1] == b"x":
+                # Large payloads arrive zlib-compressed
+                task_json = zlib.decompress(task_json)
+            if task_json[:1] != b"{":
+                logger.error("Skipping malformed task", size=len(task_json))
+                return None
+            return parse_task(orjson.loads(task_json))
+        except (orjson.JSONDecodeError, zlib.error, AttributeError, TypeError) as e:
+            logger.error("Failed to decode task", error=str(e))
+            return None
+
+    async def _process_safely(self, task: Task):
+        """
+        Process one task, logging instead of raising on failure.
+
+        Args:
+            task: Parsed task
+        """
+        try:
+            await self.process_task(task)
         except Exception as e:
-            logger.error("Failed to send git response", task_id=task_id, error=str(e))
+            logger.error("Task processing error", task_id=task.task_id, error=str(e))
+
+    def _start_task(self, task_json: bytes):
+        """
+        Decode a raw task and start it in its class's slots.
+
+        Repository removals use the light slots; everything else uses the
+        heavy ones.
+
+        Args:
+            task_json: Raw task payload from Redis
+        """
+        task = self._decode_task(task_json)
+        if task is None:
+            return
+
+        logger.debug("Received task", task_id=task.task_id)
+        in_flight = (
+            self._light_in_flight if isinstance(task, GitRemoveTask) else self._heavy_in_flight
+        )
+        running = asyncio.create_task(self._process_safely(task))
+        in_flight.add(running)
+        running.add_done_callback(in_flight.discard)
 
     async def run(self):
         """Main worker loop - process tasks from Redis queue."""
         self.running = True
         logger.info("Worker started, waiting for tasks...")
 
+        backoff = _POLL_BACKOFF_MIN
         while self.running:
             try:
-                # Block and wait for task from queue (timeout 1 second)
-                result = await self.redis.brpop("adw:tasks", timeout=1)
+                # A task's class is only known once it is popped, so take no
+                # more than both classes can start right away; the rest stay
+                # in Redis where they survive a worker restart
+                free = min(
+                    settings.worker_concurrency - len(self._heavy_in_flight),
+                    settings.light_task_concurrency - len(self._light_in_flight),
+                )
+                if free <= 0:
+                    await asyncio.wait(
+                        self._heavy_in_flight | self._light_in_flight,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    continue
+
+                # Never cancelled mid-call: Redis may already have popped the
+                # tasks, and they would be lost with the unread reply. stop()
+                # takes effect once this read returns
+                batch = await self._next_tasks(min(free, settings.task_batch_size))
 
-                if result:
-                    _, task_json = result
-                    task_data = json.loads(task_json)
-                    logger.info("Received task", task_id=task_data.get("task_id"))
+                backoff = _POLL_BACKOFF_MIN
 
-                    # Process task
-                    await self.process_task(task_data)
+                for task_json in batch:
+                    self._start_task(task_json)
 
-            except json.JSONDecodeError as e:
-                logger.error("Failed to decode task", error=str(e))
+            except (RedisConnectionError, RedisTimeoutError) as e:
+                # Back off while Redis is unreachable; jitter keeps workers
+                # from reconnecting in lockstep when it comes back
+                delay = min(backoff, _POLL_BACKOFF_MAX) * (0.5 + random.random())
+                logger.warning("Redis unavailable, retrying", error=str(e), delay=round(delay, 2))
+                await asyncio.sleep(delay)
+                backoff *= 2
             except Exception as e:
                 logger.error("Error in worker loop", error=str(e))
                 await asyncio.sleep(1)
 
+        in_flight = self._heavy_in_flight | self._light_in_flight
+        if in_flight:
+            logger.info("Waiting for in-flight tasks", count=len(in_flight))
+            await asyncio.wait(in_flight)
+
     def stop(self):
         """Stop the worker."""
         self.running = False
@@ -968,6 +1466,12 @@ async def main():
     """Main entry point for worker service."""
     worker = WorkerService()
 
+    # Stop between queue reads on docker stop or Ctrl+C, then let in-flight
+    # tasks finish
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+
     try:
         await worker.connect()
         await worker.run()
@@ -981,4 +1485,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Faster event loop for the Redis and subprocess I/O this worker is made of
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
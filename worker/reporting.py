@@ -1,17 +1,27 @@
 """Message filtering and reporting utilities for ADW workflows."""
 
 import re
-from typing import Literal
+from functools import lru_cache
+from typing import Callable, Literal
 
 MessageCategory = Literal["technical", "workflow", "agent", "error", "completion"]
 ReportingLevel = Literal["minimal", "basic", "detailed", "verbose"]
 
+# Filtering decisions are pure functions of their arguments, and the same
+# status strings recur for every task, so decisions are memoized
+_DECISION_CACHE_SIZE = 4096
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into one case-insensitive alternation, scanned in a single pass."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
 
 class MessageFilter:
     """Filters messages based on reporting level and message category."""
 
     # Technical keywords that indicate low-level operations
-    TECHNICAL_KEYWORDS = [
+    TECHNICAL_KEYWORDS = (
         "setup",
         "copying",
         "copied",
@@ -23,10 +33,10 @@ class MessageFilter:
         "updating repository",
         "cloning repository",
         "running git",
-    ]
+    )
 
     # Workflow keywords that indicate high-level progress
-    WORKFLOW_KEYWORDS = [
+    WORKFLOW_KEYWORDS = (
         "starting workflow",
         "running adw",
         "workflow started",
@@ -34,18 +44,36 @@ class MessageFilter:
         "planning",
         "building",
         "testing",
-    ]
+    )
 
     # Error keywords
-    ERROR_KEYWORDS = [
+    ERROR_KEYWORDS = (
         "error",
         "failed",
         "failure",
         "exception",
         "traceback",
-    ]
+    )
+
+    # Completion keywords
+    COMPLETION_KEYWORDS = (
+        "completed",
+        "finished",
+        "done",
+        "success",
+    )
+
+    # Very low-level technical operations, hidden even in detailed mode
+    LOW_LEVEL_PATTERNS = (
+        "created json",
+        "copied adw",
+        "installing dependencies",
+        "git checkout",
+        "git fetch",
+    )
 
     @staticmethod
+    @lru_cache(maxsize=_DECISION_CACHE_SIZE)
     def should_send_message(
         message: str,
         reporting_level: ReportingLevel,
@@ -62,63 +90,17 @@ class MessageFilter:
         Returns:
             True if the message should be sent, False otherwise
         """
-        # Verbose mode: send everything
-        if reporting_level == "verbose":
-            return True
-
-        # Minimal mode: only completion and error messages
-        if reporting_level == "minimal":
-            return category in ["completion", "error"]
-
-        # Basic mode: completion, error, and workflow messages (filter out technical)
-        if reporting_level == "basic":
-            if category in ["completion", "error"]:
-                return True
-            if category == "workflow":
-                return True
-            if category == "technical":
-                return False
-            # For uncategorized messages, check if they contain technical keywords
-            if MessageFilter._is_technical_message(message):
-                return False
-            return True
-
-        # Detailed mode: completion, error, workflow, and some technical messages
-        if reporting_level == "detailed":
-            if category in ["completion", "error", "workflow"]:
-                return True
-            if category == "technical":
-                # Allow some technical messages in detailed mode
-                return MessageFilter._is_high_level_technical(message)
+        # Verbose mode and unknown levels send everything
+        decisions = _DECISIONS.get(reporting_level)
+        if decisions is None:
             return True
 
-        # Default: send the message
-        return True
-
-    @staticmethod
-    def _is_technical_message(message: str) -> bool:
-        """Check if message contains technical keywords."""
-        message_lower = message.lower()
-        return any(keyword in message_lower for keyword in MessageFilter.TECHNICAL_KEYWORDS)
-
-    @staticmethod
-    def _is_high_level_technical(message: str) -> bool:
-        """
-        Check if technical message is high-level enough for detailed mode.
-        Filters out very low-level operations like "created json file".
-        """
-        message_lower = message.lower()
-        # Exclude very low-level operations
-        low_level_patterns = [
-            "created json",
-            "copied adw",
-            "installing dependencies",
-            "git checkout",
-            "git fetch",
-        ]
-        return not any(pattern in message_lower for pattern in low_level_patterns)
+        by_category, default = decisions
+        decision = by_category.get(category, default)
+        return decision if isinstance(decision, bool) else decision(message)
 
     @staticmethod
+    @lru_cache(maxsize=_DECISION_CACHE_SIZE)
     def categorize_message(message: str) -> MessageCategory:
         """
         Automatically categorize a message based on its content.
@@ -129,27 +111,105 @@ class MessageFilter:
         Returns:
             The message category
         """
-        message_lower = message.lower()
-
         # Check for error messages
-        if any(keyword in message_lower for keyword in MessageFilter.ERROR_KEYWORDS):
+        if _ERROR_RE.search(message):
             return "error"
 
         # Check for completion messages
-        if any(keyword in message_lower for keyword in ["completed", "finished", "done", "success"]):
+        if _COMPLETION_RE.search(message):
             return "completion"
 
         # Check for workflow messages
-        if any(keyword in message_lower for keyword in MessageFilter.WORKFLOW_KEYWORDS):
+        if _WORKFLOW_RE.search(message):
             return "workflow"
 
         # Check for technical messages
-        if MessageFilter._is_technical_message(message):
+        if _is_technical_message(message):
             return "technical"
 
         # Default to agent category (Claude Code agent output)
         return "agent"
 
+    @staticmethod
+    @lru_cache(maxsize=_DECISION_CACHE_SIZE)
+    def classify(
+        message: str,
+        reporting_level: ReportingLevel
+    ) -> tuple[MessageCategory, bool]:
+        """
+        Categorize a message and decide whether to send it in one call.
+
+        Equivalent to categorize_message followed by should_send_message,
+        but skips checks the categorization has already answered.
+
+        Args:
+            message: The message text
+            reporting_level: The reporting verbosity level
+
+        Returns:
+            Tuple of (message category, whether the message should be sent)
+        """
+        category = MessageFilter.categorize_message(message)
+        # "agent" means the technical keyword scan already found nothing,
+        # which is all basic mode checks for that category
+        if category == "agent" and reporting_level == "basic":
+            return category, True
+        return category, MessageFilter.should_send_message(message, reporting_level, category)
+
+
+# Keyword tuples are immutable, so these can never go stale. The patterns and
+# helpers live at module level so hot paths skip class attribute lookups
+_TECHNICAL_RE = _keyword_pattern(MessageFilter.TECHNICAL_KEYWORDS)
+_WORKFLOW_RE = _keyword_pattern(MessageFilter.WORKFLOW_KEYWORDS)
+_ERROR_RE = _keyword_pattern(MessageFilter.ERROR_KEYWORDS)
+_COMPLETION_RE = _keyword_pattern(MessageFilter.COMPLETION_KEYWORDS)
+_LOW_LEVEL_RE = _keyword_pattern(MessageFilter.LOW_LEVEL_PATTERNS)
+
+
+def _is_technical_message(message: str) -> bool:
+    """Check if message contains technical keywords."""
+    return _TECHNICAL_RE.search(message) is not None
+
+
+def _is_not_technical_message(message: str) -> bool:
+    """Check if message contains no technical keywords."""
+    return _TECHNICAL_RE.search(message) is None
+
+
+def _is_high_level_technical(message: str) -> bool:
+    """
+    Check if technical message is high-level enough for detailed mode.
+    Filters out very low-level operations like "created json file".
+    """
+    # Exclude very low-level operations
+    return _LOW_LEVEL_RE.search(message) is None
+
+
+# A decision is a fixed answer or a check on the message text
+_Decision = bool | Callable[[str], bool]
+
+# Per reporting level: (decision by category, decision for other categories)
+_DECISIONS: dict[str, tuple[dict[str, _Decision], _Decision]] = {
+    # Minimal mode: only completion and error messages
+    "minimal": ({"completion": True, "error": True}, False),
+    # Basic mode: completion, error, and workflow messages (filter out technical);
+    # uncategorized messages are dropped if they contain technical keywords
+    "basic": (
+        {"completion": True, "error": True, "workflow": True, "technical": False},
+        _is_not_technical_message,
+    ),
+    # Detailed mode: completion, error, workflow, and some technical messages
+    "detailed": (
+        {
+            "completion": True,
+            "error": True,
+            "workflow": True,
+            "technical": _is_high_level_technical,
+        },
+        True,
+    ),
+}
+
 
 def generate_completion_summary(
     repo_dir: str,
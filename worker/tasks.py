@@ -0,0 +1,72 @@
+"""Typed task payloads received from the bot."""
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+from reporting import ReportingLevel
+
+
+@dataclass(slots=True, frozen=True)
+class AdwTask:
+    """Run an ADW workflow against a repository."""
+
+    task_id: str | None = None
+    telegram_id: int | None = None
+    workflow_name: str = "plan_build"
+    repo_url: str | None = None
+    task_description: str | None = None
+    jira_ticket: str | None = None
+    jira_details: dict | None = None
+    reporting_level: ReportingLevel = "basic"
+
+
+@dataclass(slots=True, frozen=True)
+class GitAddTask:
+    """Clone and prime a registered repository."""
+
+    task_id: str | None = None
+    telegram_id: int | None = None
+    short_name: str | None = None
+    repo_url: str | None = None
+    full_url: str | None = None
+    repo_id: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class GitRemoveTask:
+    """Delete a registered repository's checkout."""
+
+    task_id: str | None = None
+    telegram_id: int | None = None
+    short_name: str | None = None
+    repo_id: str | None = None
+
+
+Task = AdwTask | GitAddTask | GitRemoveTask
+
+# Task type by the payload's "operation" field; anything else is an ADW task
+_TASK_TYPES: dict[str, type] = {
+    "git_add": GitAddTask,
+    "git_remove": GitRemoveTask,
+}
+_TASK_FIELDS = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (AdwTask, GitAddTask, GitRemoveTask)
+}
+
+
+def parse_task(data: dict[str, Any]) -> Task:
+    """
+    Build a typed task from a decoded payload.
+
+    Missing fields take their defaults (as with dict.get) and unknown
+    fields are ignored.
+
+    Args:
+        data: Decoded task payload from Redis
+
+    Returns:
+        AdwTask, GitAddTask or GitRemoveTask
+    """
+    cls = _TASK_TYPES.get(data.get("operation"), AdwTask)
+    return cls(**{name: data[name] for name in _TASK_FIELDS[cls] if name in data})